@@ -1,13 +1,60 @@
 from django.contrib import admin
 
-from .models import ExchangeRate
+from .changelist import CurrencyListFilter, LargeTableAdminMixin
+from .models import ExchangeRate, ExchangeRatePayload, ExchangeRateRevision, LatestExchangeRate, RenderedDocument
+from .services import delete_rates, save_rate_change
 
 
 @admin.register(ExchangeRate)
-class ExchangeRateAdmin(admin.ModelAdmin):
+class ExchangeRateAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     list_display = ["code", "name", "base_rate", "date", "fetched_at"]
-    list_filter = ["code", "date"]
-    search_fields = ["code", "name"]
-    date_hierarchy = "date"
+    # date_hierarchy는 연/월 목록을 위해 테이블 전체를 훑으므로 사용하지 않음
+    list_filter = [CurrencyListFilter, "date"]
+    search_fields = ["code"]  # 통화 코드 접두어/통화명 (LargeTableAdminMixin.get_search_results)
+    search_help_text = "통화 코드 앞부분(예: US) 또는 통화명"
     ordering = ["-date", "code"]
-    readonly_fields = ["fetched_at"]
+    readonly_fields = ["fetched_at", "updated_at"]
+
+    def get_readonly_fields(self, request, obj=None):
+        # 통화 코드/고시일은 정정 이력의 키이므로 추가할 때만 입력
+        if obj is not None:
+            return [*self.readonly_fields, "code", "date"]
+        return self.readonly_fields
+
+    # 관리자 수정/삭제도 수집과 같이 정정 이력, 최신 스냅샷, 사전 렌더링 문서에 반영
+    def save_model(self, request, obj, form, change):
+        save_rate_change(obj)
+
+    def delete_model(self, request, obj):
+        delete_rates([obj])
+
+    def delete_queryset(self, request, queryset):
+        delete_rates(queryset)
+
+
+@admin.register(ExchangeRateRevision)
+class ExchangeRateRevisionAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    list_display = ["code", "date", "base_rate", "valid_from", "superseded_at"]
+    list_filter = [CurrencyListFilter]
+    search_fields = ["code"]
+    ordering = ["-date", "code", "-superseded_at"]
+
+
+@admin.register(ExchangeRatePayload)
+class ExchangeRatePayloadAdmin(admin.ModelAdmin):
+    list_display = ["date", "fingerprint", "item_count", "fetched_at"]
+    ordering = ["-date"]
+
+
+@admin.register(LatestExchangeRate)
+class LatestExchangeRateAdmin(admin.ModelAdmin):
+    list_display = ["code", "name", "base_rate", "date", "updated_at"]
+    ordering = ["code"]
+
+
+@admin.register(RenderedDocument)
+class RenderedDocumentAdmin(admin.ModelAdmin):
+    list_display = ["key", "date", "etag", "updated_at"]
+    search_fields = ["key"]
+    exclude = ["body", "body_gzip", "body_deflate"]
+    ordering = ["-date", "key"]
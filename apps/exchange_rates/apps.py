@@ -1,7 +1,13 @@
 from django.apps import AppConfig
+from django.db.models.signals import pre_migrate
 
 
 class ExchangeRatesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.exchange_rates"
     verbose_name = "환율 정보"
+
+    def ready(self):
+        from .partitioning import check_pending_migrations
+
+        pre_migrate.connect(check_pending_migrations, sender=self)
@@ -0,0 +1,239 @@
+"""
+대용량 테이블용 관리자 목록(changelist) 구성 요소
+
+수천만 행 규모의 환율 이력에서 목록 화면이 테이블 전체를 훑지 않도록
+  - 건수: 통계 기반 추정치 (필터가 있으면 상한까지만 실제로 셈)
+  - 필터 항목: DISTINCT 조회 대신 통화 집합(LatestExchangeRate)에서 가져옴
+  - 검색: 인덱스를 탈 수 있는 통화 코드 접두어 검색
+  - 페이지 이동: OFFSET 대신 마지막 행 기준 keyset 커서
+를 사용합니다.
+"""
+
+import base64
+import binascii
+import json
+import operator
+from functools import reduce
+
+from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ChangeList
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Max, Q
+from django.utils.functional import cached_property
+
+from .models import LatestExchangeRate
+
+# keyset 커서 쿼리 파라미터 (?after=...)
+CURSOR_VAR = "after"
+
+# 필터가 걸린 목록에서 실제로 세는 최대 건수 (넘으면 추정치 사용)
+COUNT_LIMIT = 10000
+
+
+def estimated_row_count(model, using: str) -> int:
+    """테이블 전체 행 수 추정치 (PostgreSQL: 플래너 통계, 그 외: 최대 PK)"""
+    connection = connections[using]
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            # 파티션 테이블(relkind 'p')은 자체 통계가 없으므로 파티션별 추정치를 합산
+            cursor.execute(
+                "SELECT CASE WHEN c.relkind = 'p' THEN ("
+                "  SELECT SUM(p.reltuples) FILTER (WHERE p.reltuples >= 0) FROM pg_inherits i"
+                "  JOIN pg_class p ON p.oid = i.inhrelid WHERE i.inhparent = c.oid"
+                ") ELSE c.reltuples END::bigint FROM pg_class c WHERE c.oid = %s::regclass",
+                [model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        if row and row[0] is not None and row[0] > 0:  # ANALYZE 전에는 -1 (파티션 테이블은 NULL)
+            return row[0]
+    # 자동 증가 PK의 최댓값은 PK 인덱스 한 번 조회로 구할 수 있는 상한값
+    return model._default_manager.using(using).aggregate(max_pk=Max("pk"))["max_pk"] or 0
+
+
+def planner_row_estimate(queryset) -> int | None:
+    """PostgreSQL 실행 계획의 예상 행 수 (그 외 DB는 None)"""
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    COUNT(*) 전체 스캔을 피하는 Paginator
+
+    필터가 없으면 테이블 통계 추정치, 있으면 COUNT_LIMIT건까지만 실제로 세고
+    넘으면 실행 계획 추정치(또는 COUNT_LIMIT)를 건수로 사용합니다.
+    """
+
+    @cached_property
+    def count(self) -> int:
+        queryset = self.object_list
+        if not queryset.query.where and not queryset.query.distinct:
+            return estimated_row_count(queryset.model, queryset.db)
+        count = queryset.order_by()[: COUNT_LIMIT + 1].count()
+        if count <= COUNT_LIMIT:
+            return count
+        return max(planner_row_estimate(queryset) or 0, count)
+
+
+def prefix_filter(field_name: str, prefix: str, using: str) -> Q:
+    """
+    인덱스를 탈 수 있는 접두어 조건
+
+    PostgreSQL은 db_index CharField에 자동 생성되는 varchar_pattern_ops 인덱스로 LIKE 'X%'를 처리하고,
+    SQLite의 LIKE는 대소문자를 무시해 인덱스를 쓰지 못하므로 [prefix, 다음 문자열) 범위 조건으로 바꿉니다.
+    """
+    if connections[using].vendor == "postgresql":
+        return Q(**{f"{field_name}__startswith": prefix})
+    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    return Q(**{f"{field_name}__gte": prefix, f"{field_name}__lt": upper})
+
+
+class CurrencyListFilter(admin.SimpleListFilter):
+    """통화 필터 (항목은 통화당 1행인 최신 환율 스냅샷에서 가져옴)"""
+
+    title = "통화 코드"
+    parameter_name = "code"
+
+    def lookups(self, request, model_admin):
+        return [(code, f"{code} ({name})") for code, name in LatestExchangeRate.objects.values_list("code", "name")]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(code=self.value())
+        return queryset
+
+
+def encode_cursor(values: list[str]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[str]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise IncorrectLookupParameters(e) from e
+    if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+        raise IncorrectLookupParameters("잘못된 커서입니다.")
+    return values
+
+
+class KeysetChangeList(ChangeList):
+    """
+    keyset 페이지 이동 목록
+
+    현재 정렬 기준 필드의 마지막 행 값을 커서로 넘겨 다음 페이지를
+    WHERE (정렬 필드) > (커서 값) ... LIMIT n 으로 조회합니다 (OFFSET 없음).
+    """
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
+    def get_results(self, request):
+        paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+        self.cursor = request.GET.get(CURSOR_VAR) or None
+        keys = self.keyset_fields()
+
+        queryset = self.queryset
+        if self.cursor:
+            queryset = queryset.filter(self.keyset_filter(keys, decode_cursor(self.cursor)))
+        rows = list(queryset[: self.list_per_page + 1])
+        self.has_next = len(rows) > self.list_per_page
+        self.result_list = rows[: self.list_per_page]
+        self.next_cursor = None
+        if self.has_next:
+            last = self.result_list[-1]
+            self.next_cursor = encode_cursor([field.value_to_string(last) for field, _ in keys])
+
+        self.result_count = paginator.count
+        self.full_result_count = None
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.can_show_all = False
+        self.multi_page = self.has_next or self.cursor is not None
+        self.paginator = paginator
+
+    def keyset_fields(self) -> list[tuple]:
+        """정렬 기준 (필드, 내림차순 여부) 목록"""
+        keys = {}
+        for name in self.queryset.query.order_by:
+            if not isinstance(name, str):
+                raise IncorrectLookupParameters("keyset 목록은 필드 이름 정렬만 지원합니다.")
+            field = self.opts.pk if name.lstrip("-") == "pk" else self.opts.get_field(name.lstrip("-"))
+            keys.setdefault(field, name.startswith("-"))  # 관리자 ordering과 모델 Meta.ordering이 겹칠 수 있음
+        return list(keys.items())
+
+    @staticmethod
+    def keyset_filter(keys: list[tuple], values: list[str]) -> Q:
+        """(a, b, c) > (x, y, z) 를 a > x OR (a = x AND b > y) OR ... 로 전개 (필드별 정렬 방향 반영)"""
+        if len(values) != len(keys):
+            raise IncorrectLookupParameters("커서와 정렬 기준이 맞지 않습니다.")
+        try:
+            parsed = [field.to_python(value) for (field, _), value in zip(keys, values, strict=True)]
+        except Exception as e:
+            raise IncorrectLookupParameters(e) from e
+
+        conditions = []
+        for i, (field, descending) in enumerate(keys):
+            equal = {keys[j][0].attname: parsed[j] for j in range(i)}
+            lookup = "lt" if descending else "gt"
+            conditions.append(Q(**equal, **{f"{field.attname}__{lookup}": parsed[i]}))
+        # 첫 정렬 필드의 범위 조건을 함께 걸어 OR 조건에서도 인덱스 범위 스캔을 사용하도록 함
+        first, descending = keys[0]
+        bound = Q(**{f"{first.attname}__{'lte' if descending else 'gte'}": parsed[0]})
+        return bound & reduce(operator.or_, conditions)
+
+    def next_page_url(self) -> str | None:
+        if not self.next_cursor:
+            return None
+        return self.get_query_string({CURSOR_VAR: self.next_cursor})
+
+    def first_page_url(self) -> str:
+        return self.get_query_string(remove=[CURSOR_VAR])
+
+
+class LargeTableAdminMixin:
+    """대용량 테이블 관리자 설정 (추정 건수, keyset 페이지 이동, 코드 접두어 검색)"""
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    show_facets = admin.ShowFacets.NEVER
+    sortable_by = ()  # 인덱스 순서(ordering)로만 정렬
+    change_list_template = "admin/exchange_rates/large_change_list.html"
+
+    # 검색 대상 통화 코드 필드
+    code_search_field = "code"
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        통화 코드 검색
+
+        검색어를 통화 집합(최신 환율 스냅샷)의 코드 접두어/통화명과 먼저 맞춰 보고
+        결과가 있으면 code IN (...), 없으면 이력 테이블에 코드 접두어 조건을 겁니다.
+        """
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        prefix = "".join(term.split()).upper()
+        codes = list(
+            LatestExchangeRate.objects.filter(Q(code__startswith=prefix) | Q(name__icontains=term)).values_list(
+                "code", flat=True
+            )
+        )
+        if codes:
+            return queryset.filter(**{f"{self.code_search_field}__in": codes}), False
+        return queryset.filter(prefix_filter(self.code_search_field, prefix, queryset.db)), False
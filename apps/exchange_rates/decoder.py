@@ -0,0 +1,353 @@
+"""
+수출입은행 환율 응답 디코더
+
+응답 본문을 한 번 순회하면서 JSON 파싱, 값 검증, Decimal 변환, 원본 지문 계산을
+함께 수행하고, 검증에 실패한 값은 버리지 않고 Anomaly로 모아 보고합니다.
+전체 본문(list)뿐 아니라 청크 단위 스트림(bytes iterator)도 입력으로 받을 수 있어
+API 응답 스트리밍과 저장된 원본 응답 재처리(replay)에 함께 사용합니다.
+"""
+
+import codecs
+import hashlib
+import json
+import re
+from collections.abc import AsyncIterable, Iterable, Iterator
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from typing import Any, NamedTuple
+
+# API 응답 필드 -> 모델 필드
+RATE_FIELDS = {
+    "deal_bas_r": "base_rate",
+    "bkpr": "cash_buy_rate",
+    "kftc_bkpr": "cash_sell_rate",
+    "tts": "remit_send_rate",
+    "ttb": "remit_receive_rate",
+}
+
+# 수출입은행 항목별 결과 코드 (1: 성공, 2: DATA 코드 오류, 3: 인증 코드 오류, 4: 일일 제한 횟수 마감)
+RESULT_OK = 1
+
+_json_decoder = json.JSONDecoder()
+_skip_whitespace = re.compile(r"[ \t\n\r]*").match
+
+# services.payload_fingerprint 정규화 형식 (인코더를 매번 만들지 않도록 재사용)
+_encode_canonical = json.JSONEncoder(sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode
+
+
+class RateRecord(NamedTuple):
+    """검증된 통화 하나의 환율 (튜플 기반의 작은 레코드)"""
+
+    code: str  # 정규화된 통화 코드 (예: USD, JPY(100))
+    name: str
+    base_rate: Decimal
+    cash_buy_rate: Decimal | None
+    cash_sell_rate: Decimal | None
+    remit_send_rate: Decimal | None
+    remit_receive_rate: Decimal | None
+
+    def values(self) -> dict[str, Any]:
+        """ExchangeRate 값 필드 (RATE_VALUE_FIELDS)"""
+        return {
+            "name": self.name,
+            "base_rate": self.base_rate,
+            "cash_buy_rate": self.cash_buy_rate,
+            "cash_sell_rate": self.cash_sell_rate,
+            "remit_send_rate": self.remit_send_rate,
+            "remit_receive_rate": self.remit_receive_rate,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Anomaly:
+    """검증 실패 보고"""
+
+    index: int  # 응답 내 항목 순번
+    code: str
+    field: str
+    value: Any
+    reason: str  # missing_code, missing_required, invalid_number, non_positive, upstream_result, duplicate_code
+    dropped: bool  # 항목 전체를 버렸는지 여부
+
+
+@dataclass(slots=True)
+class DecodedRates:
+    """디코딩 결과"""
+
+    records: list[RateRecord] = field(default_factory=list)
+    anomalies: list[Anomaly] = field(default_factory=list)
+    fingerprint: str = ""  # services.payload_fingerprint와 같은 값
+    item_count: int = 0
+    error: dict[str, Any] | None = None  # 목록 대신 오류 객체({"result": 0, ...})가 온 경우
+
+
+class _Fingerprint:
+    """json.dumps(items, sort_keys=True, ...)의 SHA-256을 누적 계산 (항목을 모아 묶음 단위로 인코딩)"""
+
+    BATCH_SIZE = 256
+
+    def __init__(self):
+        self._hash = hashlib.sha256(b"[")
+        self._pending: list[Any] = []
+        self._first = True
+
+    def update(self, item: Any) -> None:
+        self._pending.append(item)
+        if len(self._pending) >= self.BATCH_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        if not self._first:
+            self._hash.update(b",")
+        self._first = False
+        # "[a,b,c]"에서 괄호를 뗀 "a,b,c"는 항목을 하나씩 인코딩해 쉼표로 이은 것과 같음
+        self._hash.update(_encode_canonical(self._pending)[1:-1].encode("utf-8"))
+        self._pending.clear()
+
+    def hexdigest(self) -> str:
+        self._flush()
+        digest = self._hash.copy()
+        digest.update(b"]")
+        return digest.hexdigest()
+
+
+def fingerprint_items(items: Iterable[Any]) -> str:
+    fingerprint = _Fingerprint()
+    for item in items:
+        fingerprint.update(item)
+    return fingerprint.hexdigest()
+
+
+class NotAnArray(ValueError):
+    """최상위 JSON 값이 배열이 아님 (value에 파싱된 값)"""
+
+    def __init__(self, value: Any):
+        super().__init__("JSON 본문이 배열이 아닙니다")
+        self.value = value
+
+
+class JsonArrayParser:
+    """
+    청크를 넣을 때마다 완성된 최상위 배열 원소를 돌려주는 증분 JSON 파서
+
+    동기(iter_json_array)/비동기(adecode_stream) 스트림에서 함께 사용합니다.
+    feed()가 돌려준 원소를 모두 꺼낸 뒤 다음 청크를 넣어야 합니다.
+
+    Raises:
+        NotAnArray: 최상위 값이 배열이 아닌 경우 (오류 객체 등)
+        ValueError: JSON 형식이 올바르지 않은 경우
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"  # start -> value -> separator -> ... -> end
+
+    def feed(self, chunk: bytes) -> Iterator[Any]:
+        self._buffer += self._decoder.decode(chunk)
+        return self._parse(final=False)
+
+    def close(self) -> Iterator[Any]:
+        self._buffer += self._decoder.decode(b"", final=True)
+        yield from self._parse(final=True)
+        if self._state != "end":
+            raise ValueError("JSON 본문이 완전하지 않습니다")
+
+    def _parse(self, final: bool) -> Iterator[Any]:
+        buffer, pos, state = self._buffer, self._pos, self._state
+        while True:
+            pos = _skip_whitespace(buffer, pos).end()
+            if pos >= len(buffer):
+                break
+
+            char = buffer[pos]
+            if state == "start":
+                if char != "[":
+                    if not final:
+                        break  # 배열이 아니면 본문 전체를 받은 뒤 한 번에 파싱
+                    raise NotAnArray(json.loads(buffer))
+                pos += 1
+                state = "value"
+            elif state == "separator":
+                if char == ",":
+                    pos += 1
+                    state = "value"
+                elif char == "]":
+                    pos += 1
+                    state = "end"
+                else:
+                    raise ValueError(f"JSON 배열 구분자가 올바르지 않습니다 (위치 {pos})")
+            elif state == "value":
+                if char == "]":
+                    pos += 1
+                    state = "end"
+                    continue
+                try:
+                    value, end = _json_decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break  # 원소가 아직 다 도착하지 않음
+                if end == len(buffer) and not final and not isinstance(value, dict | list | str):
+                    break  # 숫자/리터럴은 다음 청크에서 이어질 수 있음
+                pos = end
+                state = "separator"
+                self._pos, self._state = pos, state
+                yield value
+            else:
+                raise ValueError(f"JSON 본문 뒤에 불필요한 데이터가 있습니다 (위치 {pos})")
+
+            # 처리한 앞부분은 버려 버퍼가 본문 크기만큼 커지지 않도록 함
+            if pos > 65536:
+                buffer = buffer[pos:]
+                pos = 0
+                self._buffer = buffer
+        self._buffer, self._pos, self._state = buffer, pos, state
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    청크 단위 JSON 본문에서 최상위 배열의 원소를 완성되는 대로 yield 합니다.
+
+    Raises:
+        NotAnArray: 최상위 값이 배열이 아닌 경우 (오류 객체 등)
+        ValueError: JSON 형식이 올바르지 않은 경우
+    """
+    parser = JsonArrayParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+def normalize_code(value: Any) -> str:
+    """통화 코드 정규화: 공백 제거/대문자화 (' jpy (100)' -> 'JPY(100)')"""
+    if isinstance(value, str) and value.isalpha() and value.isupper():
+        return value  # 대부분의 통화 (USD, EUR ...)
+    return "".join(str(value).split()).upper()
+
+
+def _parse_decimal(value: Any) -> Decimal | None:
+    """쉼표 포함 숫자 문자열/JSON 숫자 파싱 (빈 값은 None, 그 외 형식은 ValueError)"""
+    if type(value) is str:
+        if value == "":
+            return None
+        try:
+            number = Decimal(value.replace(",", "") if "," in value else value)
+        except InvalidOperation:
+            raise ValueError(value) from None
+    elif value is None:
+        return None
+    elif type(value) is int or type(value) is float:  # bool은 int의 하위 타입이므로 type으로 비교
+        number = Decimal(str(value))
+    else:
+        raise ValueError(value)
+    if not number.is_finite():  # NaN, Infinity
+        raise ValueError(value)
+    return number
+
+
+class RateDecoder:
+    """항목을 하나씩 받아 검증/변환하는 디코더 (decode_items/decode_stream에서 사용)"""
+
+    def __init__(self):
+        self.result = DecodedRates()
+        self._fingerprint = _Fingerprint()
+        self._records: dict[str, RateRecord] = {}
+
+    def feed(self, item: Any) -> None:
+        index = self.result.item_count
+        self.result.item_count += 1
+        self._fingerprint.update(item)
+
+        if not isinstance(item, dict):
+            self._report(index, "", "", item, "invalid_item", dropped=True)
+            return
+
+        result_code = item.get("result", RESULT_OK)
+        if result_code != RESULT_OK:
+            self._report(index, str(item.get("cur_unit", "")), "result", result_code, "upstream_result", dropped=True)
+            return
+
+        raw_code = item.get("cur_unit")
+        code = normalize_code(raw_code) if raw_code else ""
+        if not code:
+            self._report(index, "", "cur_unit", raw_code, "missing_code", dropped=True)
+            return
+
+        rates: dict[str, Decimal | None] = {}
+        get = item.get
+        for api_field, model_field in RATE_FIELDS.items():
+            raw = get(api_field)
+            try:
+                rates[model_field] = _parse_decimal(raw)
+            except ValueError:
+                rates[model_field] = None
+                self._report(index, code, api_field, raw, "invalid_number", dropped=model_field == "base_rate")
+
+        base_rate = rates["base_rate"]
+        if base_rate is None:
+            if item.get("deal_bas_r") in (None, ""):
+                self._report(index, code, "deal_bas_r", item.get("deal_bas_r"), "missing_required", dropped=True)
+            return
+        if base_rate <= 0:
+            self._report(index, code, "deal_bas_r", item.get("deal_bas_r"), "non_positive", dropped=True)
+            return
+
+        if code in self._records:
+            # 같은 통화가 두 번 오면 나중 값 사용 (기존 update_or_create 동작과 동일)
+            self._report(index, code, "cur_unit", raw_code, "duplicate_code", dropped=False)
+            del self._records[code]
+
+        self._records[code] = RateRecord(code=code, name=str(get("cur_nm") or "").strip(), **rates)
+
+    def finish(self, error: Any = None) -> DecodedRates:
+        self.result.records = list(self._records.values())
+        self.result.fingerprint = self._fingerprint.hexdigest()
+        self.result.error = error
+        return self.result
+
+    def _report(self, index: int, code: str, field_name: str, value: Any, reason: str, dropped: bool) -> None:
+        self.result.anomalies.append(
+            Anomaly(index=index, code=code, field=field_name, value=value, reason=reason, dropped=dropped)
+        )
+
+
+def decode_items(items: Iterable[Any]) -> DecodedRates:
+    """이미 파싱된 응답(list)을 검증/변환"""
+    decoder = RateDecoder()
+    for item in items:
+        decoder.feed(item)
+    return decoder.finish()
+
+
+def decode_stream(chunks: Iterable[bytes]) -> DecodedRates:
+    """
+    청크 단위 응답 본문을 파싱과 동시에 검증/변환합니다.
+
+    본문이 목록이 아닌 오류 객체이면 result.error에 담아 돌려줍니다.
+    """
+    decoder = RateDecoder()
+    try:
+        for value in iter_json_array(chunks):
+            decoder.feed(value)
+    except NotAnArray as e:
+        return decoder.finish(error=e.value)
+    return decoder.finish()
+
+
+async def adecode_stream(chunks: AsyncIterable[bytes]) -> DecodedRates:
+    """decode_stream의 비동기 버전 (httpx Response.aiter_bytes() 등)"""
+    decoder = RateDecoder()
+    parser = JsonArrayParser()
+    try:
+        async for chunk in chunks:
+            for value in parser.feed(chunk):
+                decoder.feed(value)
+        for value in parser.close():
+            decoder.feed(value)
+    except NotAnArray as e:
+        return decoder.finish(error=e.value)
+    return decoder.finish()
@@ -0,0 +1,149 @@
+"""
+사전 렌더링/사전 압축 조회 문서
+
+고시일별 환율은 수집 후 거의 바뀌지 않으므로, 수집 커밋 직후 조회 응답(JSON)을
+한 번 렌더링해 원문/gzip/deflate 세 가지로 저장해 두고,
+조회 시에는 키 하나로 조회한 바이트를 그대로 응답합니다.
+환율이 바뀌는 트랜잭션(수집, 관리자 수정/삭제)에서 해당 고시일 문서를 먼저 삭제하므로
+다시 렌더링되기 전이나 렌더링에 실패한 경우에는 DB 동적 조회 경로로 응답합니다.
+"""
+
+import gzip
+import hashlib
+import zlib
+from datetime import date
+
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework.renderers import JSONRenderer
+
+from .models import ExchangeRate, RenderedDocument
+from .serializers import ExchangeRateSerializer
+
+# Content-Encoding -> RenderedDocument 필드 (같은 q 값이면 앞쪽 우선)
+ENCODING_FIELDS = {
+    "gzip": "body_gzip",
+    "deflate": "body_deflate",
+    "identity": "body",
+}
+
+
+def day_document_key(rate_date: date | str) -> str:
+    """GET /api/exchange-rates/dates/{date}/ 문서 키"""
+    return f"rates/{rate_date}"
+
+
+def currency_document_key(code: str, rate_date: date | str) -> str:
+    """GET /api/exchange-rates/{code}/dates/{date}/ 문서 키"""
+    return f"rates/{code}/{rate_date}"
+
+
+def _build_document(key: str, rate_date: date, body: bytes, rendered_at) -> RenderedDocument:
+    return RenderedDocument(
+        key=key,
+        date=rate_date,
+        body=body,
+        body_gzip=gzip.compress(body, mtime=0),
+        body_deflate=zlib.compress(body),
+        etag=f'W/"{hashlib.sha256(body).hexdigest()[:32]}"',
+        updated_at=rendered_at,
+    )
+
+
+def render_daily_documents(rate_date: date) -> int:
+    """
+    고시일 하나의 일별 문서와 통화별 문서를 렌더링해 저장합니다.
+
+    동적 조회 경로와 같은 Serializer/Renderer를 사용하므로 응답 바이트가 동일합니다.
+
+    Returns:
+        저장된 문서 개수
+    """
+    rates = list(ExchangeRate.objects.filter(date=rate_date).order_by("code"))
+    if not rates:
+        return 0
+
+    renderer = JSONRenderer()
+    rendered_at = timezone.now()
+    documents = [
+        _build_document(
+            day_document_key(rate_date),
+            rate_date,
+            renderer.render(ExchangeRateSerializer(rates, many=True).data),
+            rendered_at,
+        )
+    ]
+    documents += [
+        _build_document(
+            currency_document_key(rate.code, rate_date),
+            rate_date,
+            renderer.render(ExchangeRateSerializer(rate).data),
+            rendered_at,
+        )
+        for rate in rates
+    ]
+
+    RenderedDocument.objects.bulk_create(
+        documents,
+        update_conflicts=True,
+        unique_fields=["key"],
+        update_fields=["date", "body", "body_gzip", "body_deflate", "etag", "updated_at"],
+    )
+    return len(documents)
+
+
+def negotiate_encoding(accept_encoding: str) -> str:
+    """Accept-Encoding 헤더에서 gzip/deflate/identity 중 응답 인코딩 선택"""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[coding] = quality
+
+    wildcard = weights.get("*")
+    best, best_quality = "identity", 0.0
+    for coding in ("gzip", "deflate"):
+        quality = weights.get(coding, wildcard if wildcard is not None else 0.0)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+async def aserve_document(request: HttpRequest, key: str) -> HttpResponse | None:
+    """
+    사전 렌더링 문서를 응답합니다 (문서가 없으면 None).
+
+    Accept-Encoding에 맞는 본문 하나만 조회하며, ETag/Last-Modified 조건부 요청이면 304를 돌려줍니다.
+    """
+    encoding = negotiate_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+    document = await (
+        RenderedDocument.objects.filter(key=key).values_list(ENCODING_FIELDS[encoding], "etag", "updated_at").afirst()
+    )
+    if document is None:
+        return None
+
+    body, etag, updated_at = document
+    last_modified = int(updated_at.timestamp())
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = HttpResponse(bytes(body), content_type="application/json")
+        if encoding != "identity":
+            response["Content-Encoding"] = encoding
+        response["Content-Length"] = str(len(response.content))
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    patch_vary_headers(response, ["Accept-Encoding"])
+    return response
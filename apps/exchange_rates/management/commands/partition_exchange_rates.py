@@ -0,0 +1,51 @@
+"""
+환율 이력 테이블을 PostgreSQL 연도별 파티션 테이블로 전환하거나 단일 테이블로 되돌립니다.
+
+    python manage.py partition_exchange_rates           # 단일 테이블 -> 연도별 파티션 + BRIN
+    python manage.py partition_exchange_rates --revert  # 파티션 테이블 -> Django 기본 구성
+"""
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.migrations.executor import MigrationExecutor
+
+from apps.exchange_rates import partitioning
+
+
+class Command(BaseCommand):
+    help = "환율 이력 테이블을 PostgreSQL 연도별 파티션 테이블로 전환합니다 (--revert: 되돌리기)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--revert", action="store_true", help="파티션 테이블을 단일 테이블로 되돌립니다.")
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS, help="대상 DB alias (기본값: default)")
+
+    def handle(self, *args, revert=False, database=DEFAULT_DB_ALIAS, **options):
+        connection = connections[database]
+        if connection.vendor != "postgresql":
+            raise CommandError("파티션 저장소는 PostgreSQL 전용입니다.")
+
+        # 파티션 테이블은 최신 migration 상태의 컬럼을 그대로 복사하므로 migrate가 끝난 상태에서만 전환
+        executor = MigrationExecutor(connection)
+        pending = [
+            migration
+            for migration, _ in executor.migration_plan(executor.loader.graph.leaf_nodes())
+            if migration.app_label == "exchange_rates"
+        ]
+        if pending:
+            raise CommandError("적용되지 않은 exchange_rates migration이 있습니다. migrate 후 다시 실행하세요.")
+
+        model = apps.get_model("exchange_rates", "ExchangeRate")
+        partitioned = partitioning.is_partitioned(connection)
+        if partitioned != revert:
+            self.stdout.write("이미 파티션 테이블입니다." if partitioned else "이미 단일 테이블입니다.")
+            return
+
+        with connection.schema_editor() as schema_editor:
+            if revert:
+                partitioning.unpartition_table(model, schema_editor)
+            else:
+                partitioning.partition_table(model, schema_editor)
+        self.stdout.write(
+            self.style.SUCCESS("단일 테이블로 되돌렸습니다." if revert else "파티션 테이블로 전환했습니다.")
+        )
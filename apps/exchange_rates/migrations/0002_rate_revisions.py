@@ -0,0 +1,63 @@
+# Generated by Django 6.1.2 on 2026-10-19 12:23
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def backfill_updated_at(apps, schema_editor):
+    """기존 행은 수집 시간부터 현재 값이 알려진 것으로 간주"""
+    ExchangeRate = apps.get_model('exchange_rates', 'ExchangeRate')
+    ExchangeRate.objects.update(updated_at=models.F('fetched_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exchange_rates', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExchangeRatePayload',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True, verbose_name='고시일')),
+                ('fingerprint', models.CharField(max_length=64, verbose_name='응답 지문 (SHA-256)')),
+                ('item_count', models.PositiveIntegerField(verbose_name='항목 수')),
+                ('fetched_at', models.DateTimeField(auto_now=True, verbose_name='수집 시간')),
+            ],
+            options={
+                'verbose_name': '환율 원본 지문',
+                'verbose_name_plural': '환율 원본 지문 목록',
+                'ordering': ['-date'],
+            },
+        ),
+        migrations.AddField(
+            model_name='exchangerate',
+            name='updated_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='반영 시간'),
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='ExchangeRateRevision',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.CharField(max_length=10, verbose_name='통화 코드')),
+                ('date', models.DateField(verbose_name='고시일')),
+                ('name', models.CharField(max_length=50, verbose_name='통화명')),
+                ('base_rate', models.DecimalField(decimal_places=4, max_digits=15, verbose_name='매매기준율')),
+                ('cash_buy_rate', models.DecimalField(blank=True, decimal_places=4, max_digits=15, null=True, verbose_name='현찰 살 때')),
+                ('cash_sell_rate', models.DecimalField(blank=True, decimal_places=4, max_digits=15, null=True, verbose_name='현찰 팔 때')),
+                ('remit_send_rate', models.DecimalField(blank=True, decimal_places=4, max_digits=15, null=True, verbose_name='송금 보낼 때')),
+                ('remit_receive_rate', models.DecimalField(blank=True, decimal_places=4, max_digits=15, null=True, verbose_name='송금 받을 때')),
+                ('valid_from', models.DateTimeField(verbose_name='반영 시간')),
+                ('superseded_at', models.DateTimeField(verbose_name='대체 시간')),
+            ],
+            options={
+                'verbose_name': '환율 정정 이력',
+                'verbose_name_plural': '환율 정정 이력 목록',
+                'ordering': ['-date', 'code', '-superseded_at'],
+                'indexes': [models.Index(fields=['code', 'date', 'superseded_at'], name='exchange_ra_code_06450c_idx')],
+            },
+        ),
+    ]
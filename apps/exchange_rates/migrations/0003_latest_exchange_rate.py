@@ -0,0 +1,53 @@
+# Generated by Django 6.1.2 on 2026-10-19 12:28
+
+from django.db import migrations, models
+
+RATE_VALUE_FIELDS = ['name', 'base_rate', 'cash_buy_rate', 'cash_sell_rate', 'remit_send_rate', 'remit_receive_rate']
+
+
+def backfill_latest(apps, schema_editor):
+    """기존 이력에서 통화별 최신 고시일 행으로 스냅샷 생성"""
+    ExchangeRate = apps.get_model('exchange_rates', 'ExchangeRate')
+    LatestExchangeRate = apps.get_model('exchange_rates', 'LatestExchangeRate')
+
+    latest = {}
+    for rate in ExchangeRate.objects.order_by('code', '-date').iterator():
+        if rate.code not in latest:
+            latest[rate.code] = LatestExchangeRate(
+                code=rate.code,
+                date=rate.date,
+                updated_at=rate.updated_at,
+                **{field: getattr(rate, field) for field in RATE_VALUE_FIELDS},
+            )
+    LatestExchangeRate.objects.bulk_create(latest.values())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exchange_rates', '0002_rate_revisions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LatestExchangeRate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.CharField(max_length=10, unique=True, verbose_name='통화 코드')),
+                ('name', models.CharField(max_length=50, verbose_name='통화명')),
+                ('base_rate', models.DecimalField(decimal_places=4, max_digits=15, verbose_name='매매기준율')),
+                ('cash_buy_rate', models.DecimalField(blank=True, decimal_places=4, max_digits=15, null=True, verbose_name='현찰 살 때')),
+                ('cash_sell_rate', models.DecimalField(blank=True, decimal_places=4, max_digits=15, null=True, verbose_name='현찰 팔 때')),
+                ('remit_send_rate', models.DecimalField(blank=True, decimal_places=4, max_digits=15, null=True, verbose_name='송금 보낼 때')),
+                ('remit_receive_rate', models.DecimalField(blank=True, decimal_places=4, max_digits=15, null=True, verbose_name='송금 받을 때')),
+                ('date', models.DateField(verbose_name='고시일')),
+                ('updated_at', models.DateTimeField(verbose_name='반영 시간')),
+            ],
+            options={
+                'verbose_name': '최신 환율',
+                'verbose_name_plural': '최신 환율 목록',
+                'ordering': ['code'],
+            },
+        ),
+        migrations.RunPython(backfill_latest, migrations.RunPython.noop),
+    ]
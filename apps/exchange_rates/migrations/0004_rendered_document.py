@@ -0,0 +1,31 @@
+# Generated by Django 6.1.2 on 2026-10-19 12:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exchange_rates', '0003_latest_exchange_rate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RenderedDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64, unique=True, verbose_name='문서 키')),
+                ('date', models.DateField(db_index=True, verbose_name='고시일')),
+                ('body', models.BinaryField(verbose_name='JSON')),
+                ('body_gzip', models.BinaryField(verbose_name='JSON (gzip)')),
+                ('body_deflate', models.BinaryField(verbose_name='JSON (deflate)')),
+                ('etag', models.CharField(max_length=80, verbose_name='ETag')),
+                ('updated_at', models.DateTimeField(verbose_name='렌더링 시간')),
+            ],
+            options={
+                'verbose_name': '사전 렌더링 문서',
+                'verbose_name_plural': '사전 렌더링 문서 목록',
+                'ordering': ['-date', 'key'],
+            },
+        ),
+    ]
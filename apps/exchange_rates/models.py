@@ -1,4 +1,15 @@
 from django.db import models
+from django.utils import timezone
+
+# 환율 값 필드 (변경 감지 및 이력 보관 대상)
+RATE_VALUE_FIELDS = [
+    "name",
+    "base_rate",
+    "cash_buy_rate",
+    "cash_sell_rate",
+    "remit_send_rate",
+    "remit_receive_rate",
+]
 
 
 class ExchangeRate(models.Model):
@@ -17,6 +28,7 @@ class ExchangeRate(models.Model):
     # 메타 정보
     date = models.DateField("고시일", db_index=True)
     fetched_at = models.DateTimeField("수집 시간", auto_now_add=True)
+    updated_at = models.DateTimeField("반영 시간", default=timezone.now)  # 현재 값이 알려진 시점
 
     class Meta:
         verbose_name = "환율"
@@ -29,3 +41,95 @@ class ExchangeRate(models.Model):
 
     def __str__(self):
         return f"{self.code} ({self.date}): {self.base_rate}"
+
+
+class ExchangeRateRevision(models.Model):
+    """정정(재고시)으로 대체된 이전 환율 값 이력"""
+
+    code = models.CharField("통화 코드", max_length=10)
+    date = models.DateField("고시일")
+
+    name = models.CharField("통화명", max_length=50)
+    base_rate = models.DecimalField("매매기준율", max_digits=15, decimal_places=4)
+    cash_buy_rate = models.DecimalField("현찰 살 때", max_digits=15, decimal_places=4, null=True, blank=True)
+    cash_sell_rate = models.DecimalField("현찰 팔 때", max_digits=15, decimal_places=4, null=True, blank=True)
+    remit_send_rate = models.DecimalField("송금 보낼 때", max_digits=15, decimal_places=4, null=True, blank=True)
+    remit_receive_rate = models.DecimalField("송금 받을 때", max_digits=15, decimal_places=4, null=True, blank=True)
+
+    # 이 값이 유효했던 구간 [valid_from, superseded_at)
+    valid_from = models.DateTimeField("반영 시간")
+    superseded_at = models.DateTimeField("대체 시간")
+
+    class Meta:
+        verbose_name = "환율 정정 이력"
+        verbose_name_plural = "환율 정정 이력 목록"
+        ordering = ["-date", "code", "-superseded_at"]
+        indexes = [
+            models.Index(fields=["code", "date", "superseded_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.code} ({self.date}): {self.base_rate} [~{self.superseded_at:%Y-%m-%d %H:%M}]"
+
+
+class ExchangeRatePayload(models.Model):
+    """고시일별 API 원본 응답 지문 (변경 없는 재수집 건너뛰기용)"""
+
+    date = models.DateField("고시일", unique=True)
+    fingerprint = models.CharField("응답 지문 (SHA-256)", max_length=64)
+    item_count = models.PositiveIntegerField("항목 수")
+    fetched_at = models.DateTimeField("수집 시간", auto_now=True)
+
+    class Meta:
+        verbose_name = "환율 원본 지문"
+        verbose_name_plural = "환율 원본 지문 목록"
+        ordering = ["-date"]
+
+    def __str__(self):
+        return f"{self.date}: {self.fingerprint[:12]}"
+
+
+class LatestExchangeRate(models.Model):
+    """통화별 최신 환율 스냅샷 (통화당 1행, 수집 시 같은 트랜잭션에서 갱신)"""
+
+    code = models.CharField("통화 코드", max_length=10, unique=True)
+    name = models.CharField("통화명", max_length=50)
+
+    base_rate = models.DecimalField("매매기준율", max_digits=15, decimal_places=4)
+    cash_buy_rate = models.DecimalField("현찰 살 때", max_digits=15, decimal_places=4, null=True, blank=True)
+    cash_sell_rate = models.DecimalField("현찰 팔 때", max_digits=15, decimal_places=4, null=True, blank=True)
+    remit_send_rate = models.DecimalField("송금 보낼 때", max_digits=15, decimal_places=4, null=True, blank=True)
+    remit_receive_rate = models.DecimalField("송금 받을 때", max_digits=15, decimal_places=4, null=True, blank=True)
+
+    date = models.DateField("고시일")
+    updated_at = models.DateTimeField("반영 시간")
+
+    class Meta:
+        verbose_name = "최신 환율"
+        verbose_name_plural = "최신 환율 목록"
+        ordering = ["code"]
+
+    def __str__(self):
+        return f"{self.code} ({self.date}): {self.base_rate}"
+
+
+class RenderedDocument(models.Model):
+    """수집 직후 미리 렌더링한 조회 응답 (JSON 원문 + gzip/deflate 압축본)"""
+
+    key = models.CharField("문서 키", max_length=64, unique=True)  # rates/2024-01-15, rates/USD/2024-01-15
+    date = models.DateField("고시일", db_index=True)
+
+    body = models.BinaryField("JSON")
+    body_gzip = models.BinaryField("JSON (gzip)")
+    body_deflate = models.BinaryField("JSON (deflate)")
+
+    etag = models.CharField("ETag", max_length=80)
+    updated_at = models.DateTimeField("렌더링 시간")
+
+    class Meta:
+        verbose_name = "사전 렌더링 문서"
+        verbose_name_plural = "사전 렌더링 문서 목록"
+        ordering = ["-date", "key"]
+
+    def __str__(self):
+        return self.key
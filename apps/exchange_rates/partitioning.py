@@ -0,0 +1,202 @@
+"""
+PostgreSQL 환율 이력 연도별 파티션 저장소 (선택)
+
+PostgreSQL에서 `manage.py partition_exchange_rates`를 실행하면 환율 이력 테이블을
+고시일(date) 기준 연도별 RANGE 파티션 테이블로 전환합니다 (--revert로 되돌림).
+  - 테이블/컬럼 이름은 그대로라 ORM 코드는 바뀌지 않고, date 조건은 파티션 pruning으로 처리됨
+  - date B-tree 대신 BRIN 인덱스, 중복되는 code 단일/(code, date) 인덱스는 만들지 않음
+    (code 조회는 UNIQUE (code, date), 접두어 검색은 varchar_pattern_ops 인덱스 사용)
+  - 연도 파티션은 수집(원본이 바뀐 경우) 시 ensure_partitions()가 EXCHANGE_RATE_PARTITION_YEARS_AHEAD년 앞까지 만들고,
+    파티션이 없는 날짜는 DEFAULT 파티션에 들어갔다가 해당 연도 파티션을 만들 때 옮겨짐
+전환하지 않은 DB(SQLite 포함)는 Django migration이 만든 단일 테이블 구성을 그대로 사용합니다.
+
+파티션 테이블의 인덱스/PK는 migration 상태(ExchangeRate.Meta)와 다르므로 migration이 아닌
+명시적인 명령으로만 전환하며, 파티션 상태에서는 exchange_rates migration 적용을 막습니다
+(check_pending_migrations). 새 migration은 --revert → migrate → 다시 전환 순서로 적용합니다.
+"""
+
+import threading
+from collections.abc import Iterable
+from datetime import date
+from functools import partial
+
+from django.conf import settings
+from django.core.management.base import CommandError
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+
+TABLE = "exchange_rates_exchangerate"
+DEFAULT_PARTITION = f"{TABLE}_default"
+
+# 파티션 테이블의 인덱스/제약 조건 (Django가 만든 단일 테이블의 이름과 겹치지 않도록 별도 이름 사용)
+PARTITIONED_INDEXES = [
+    f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_part_pkey PRIMARY KEY (id, date)",
+    f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_part_code_date_uniq UNIQUE (code, date)",
+    f"CREATE INDEX {TABLE}_part_code_like ON {TABLE} (code varchar_pattern_ops)",
+    f"CREATE INDEX {TABLE}_part_date_brin ON {TABLE} USING brin (date)",
+]
+
+# DB alias -> 파티션 테이블 여부 / 이미 있는 연도 파티션
+_partitioned: dict[str, bool] = {}
+_known_years: dict[str, set[int]] = {}
+_lock = threading.RLock()  # ensure_partitions 안의 on_commit 콜백이 바로 실행될 수 있음
+
+
+def partition_name(year: int) -> str:
+    return f"{TABLE}_y{year}"
+
+
+def is_partitioned(connection) -> bool:
+    """환율 이력 테이블이 실제로 파티션 테이블인지 (DB alias별로 캐시)"""
+    if connection.vendor != "postgresql":
+        return False
+    if connection.alias not in _partitioned:
+        _partitioned[connection.alias] = _query_partitioned(connection)
+    return _partitioned[connection.alias]
+
+
+def _query_partitioned(connection) -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [TABLE])
+        row = cursor.fetchone()
+    return bool(row) and row[0] == "p"
+
+
+def check_pending_migrations(sender, using=DEFAULT_DB_ALIAS, plan=None, **kwargs) -> None:
+    """
+    pre_migrate 시그널: 파티션 테이블에 exchange_rates migration을 적용하지 않도록 막습니다.
+
+    migration 상태의 인덱스/PK가 실제 테이블에 없어 인덱스 변경 migration이 중간에 실패하기 때문입니다.
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql" or not plan:
+        return
+    if not any(migration.app_label == "exchange_rates" for migration, _ in plan):
+        return
+    # 테스트 DB 생성 등 같은 alias가 다른 DB를 가리킬 수 있으므로 캐시 없이 확인
+    if _query_partitioned(connection):
+        raise CommandError(
+            "환율 이력 테이블이 파티션 테이블입니다. "
+            "`manage.py partition_exchange_rates --revert`로 되돌린 뒤 migrate 하고 다시 전환하세요."
+        )
+
+
+def existing_partition_years(connection) -> set[int]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(%s)",
+            [TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    prefix = partition_name(0)[:-1]
+    return {int(name.removeprefix(prefix)) for name in names if name.startswith(prefix)}
+
+
+def create_partition(connection, year: int) -> None:
+    """
+    연도 파티션 생성
+
+    빈 테이블을 만들어 DEFAULT 파티션에 있던 해당 연도 행을 옮긴 뒤 ATTACH 합니다
+    (DEFAULT 파티션에 같은 연도 행이 있으면 CREATE ... PARTITION OF는 실패하기 때문).
+    """
+    name = partition_name(year)
+    bounds = [date(year, 1, 1), date(year + 1, 1, 1)]
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        # 여러 프로세스가 동시에 같은 파티션을 만들지 않도록 직렬화
+        cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", [TABLE])
+        if year in existing_partition_years(connection):
+            return
+        cursor.execute(f"CREATE TABLE {name} (LIKE {TABLE} INCLUDING DEFAULTS)")
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE date >= %s AND date < %s RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved",
+            bounds,
+        )
+        cursor.execute(f"ALTER TABLE {TABLE} ATTACH PARTITION {name} FOR VALUES FROM (%s) TO (%s)", bounds)
+
+
+def ensure_partitions(dates: Iterable[date], using: str = "default") -> None:
+    """
+    주어진 날짜와 올해부터 EXCHANGE_RATE_PARTITION_YEARS_AHEAD년 뒤까지의 연도 파티션을 만듭니다.
+
+    파티션 테이블이 아니면 아무것도 하지 않으며, 확인한 연도는 프로세스 안에서 캐시합니다.
+    저장 트랜잭션 안에서 호출할 수 있습니다 (파티션 생성이 같은 트랜잭션으로 커밋됨).
+    """
+    connection = connections[using]
+    if not is_partitioned(connection):
+        return
+    this_year = timezone.localdate().year
+    years = {d.year for d in dates}
+    years.update(range(this_year, this_year + settings.EXCHANGE_RATE_PARTITION_YEARS_AHEAD + 1))
+    with _lock:
+        if using not in _known_years:
+            _known_years[using] = existing_partition_years(connection)
+        missing = years - _known_years[using]
+        for year in sorted(missing):
+            create_partition(connection, year)
+            # 호출한 트랜잭션이 롤백되면 파티션도 없어지므로 커밋된 뒤에만 캐시
+            transaction.on_commit(partial(_remember, using, year), using=using)
+
+
+def _remember(using: str, year: int) -> None:
+    with _lock:
+        _known_years.setdefault(using, set()).add(year)
+
+
+def _copy_rows(cursor, source: str, target: str, columns: list[str]) -> None:
+    column_list = ", ".join(columns)
+    cursor.execute(f"INSERT INTO {target} ({column_list}) SELECT {column_list} FROM {source}")
+    # 복사한 id 다음 값부터 발급되도록 identity 시퀀스 조정
+    cursor.execute(
+        f"SELECT setval(pg_get_serial_sequence(%s, 'id'), COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) FROM {target}",
+        [target],
+    )
+
+
+def _forget(connection) -> None:
+    _partitioned.pop(connection.alias, None)
+    _known_years.pop(connection.alias, None)
+
+
+def partition_table(model, schema_editor) -> None:
+    """단일 테이블 -> 연도별 파티션 테이블 (기존 행 포함)"""
+    connection = schema_editor.connection
+    columns = [field.column for field in model._meta.local_concrete_fields]
+    heap = f"{TABLE}_heap"
+    with connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {TABLE} RENAME TO {heap}")
+        cursor.execute(
+            f"CREATE TABLE {TABLE} (LIKE {heap} INCLUDING DEFAULTS INCLUDING IDENTITY) PARTITION BY RANGE (date)"
+        )
+        for statement in PARTITIONED_INDEXES:
+            cursor.execute(statement)
+        cursor.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {TABLE} DEFAULT")
+
+        cursor.execute(f"SELECT EXTRACT(year FROM MIN(date))::int FROM {heap}")
+        this_year = timezone.localdate().year
+        first_year = min(cursor.fetchone()[0] or this_year, this_year)
+        for year in range(first_year, this_year + settings.EXCHANGE_RATE_PARTITION_YEARS_AHEAD + 1):
+            cursor.execute(
+                f"CREATE TABLE {partition_name(year)} PARTITION OF {TABLE} FOR VALUES FROM (%s) TO (%s)",
+                [date(year, 1, 1), date(year + 1, 1, 1)],
+            )
+
+        _copy_rows(cursor, heap, TABLE, columns)
+        cursor.execute(f"DROP TABLE {heap}")
+        cursor.execute(f"ANALYZE {TABLE}")
+    _forget(connection)
+
+
+def unpartition_table(model, schema_editor) -> None:
+    """연도별 파티션 테이블 -> 단일 테이블 (Django 기본 구성으로 되돌림)"""
+    connection = schema_editor.connection
+    columns = [field.column for field in model._meta.local_concrete_fields]
+    partitioned = f"{TABLE}_partitioned"
+    with connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {TABLE} RENAME TO {partitioned}")
+    schema_editor.create_model(model)
+    with connection.cursor() as cursor:
+        _copy_rows(cursor, partitioned, TABLE, columns)
+        cursor.execute(f"DROP TABLE {partitioned}")  # 파티션도 함께 삭제됨
+    _forget(connection)
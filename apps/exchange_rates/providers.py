@@ -0,0 +1,45 @@
+"""
+수집 파이프라인용 한국수출입은행 환율 프로바이더
+"""
+
+from dataclasses import replace
+from datetime import date
+
+import httpx
+
+from apps.harvesting.providers import Provider
+
+from .decoder import DecodedRates, RateRecord
+from .services import afetch_decoded_rates, store_decoded_rates
+
+
+class KoreaEximProvider(Provider):
+    """
+    한국수출입은행 환율 프로바이더
+
+    한 번의 호출로 그날의 전체 통화가 오므로 심볼은 하나입니다.
+    응답 본문은 afetch_decoded_rates로 받는 대로 디코딩하고(save_exchange_rates와 같은 경로),
+    parse/normalize는 검증된 RateRecord 단위로 동작합니다.
+
+    저장 시 지문은 응답 원본 전체에 대해 계산되므로 whole_payload 모드로
+    하루치 응답을 나누지 않고 store_decoded_rates에 넘깁니다.
+    """
+
+    name = "koreaexim"
+    rate_limit = 1  # 초당 1회 (API 호출 한도는 하루 1,000회)
+    max_concurrency = 1
+    whole_payload = True
+
+    async def fetch(self, client: httpx.AsyncClient, symbol: str | None, target_date: date) -> DecodedRates:
+        return await afetch_decoded_rates(target_date, client=client)
+
+    def parse(self, raw: DecodedRates, symbol: str | None, target_date: date) -> list[RateRecord]:
+        return raw.records
+
+    def write_payload(self, raw: DecodedRates, records: list[RateRecord], target_date: date) -> int:
+        if not raw.item_count:
+            return 0
+        return store_decoded_rates(replace(raw, records=records), target_date)
+
+    def write(self, records: list[RateRecord], target_date: date) -> int:
+        raise NotImplementedError("whole_payload 프로바이더는 write_payload로 저장합니다.")
@@ -4,7 +4,7 @@
 
 from rest_framework import serializers
 
-from .models import ExchangeRate
+from .models import ExchangeRate, LatestExchangeRate
 
 
 class ExchangeRateSerializer(serializers.ModelSerializer):
@@ -23,5 +23,25 @@ class ExchangeRateSerializer(serializers.ModelSerializer):
             "remit_receive_rate",
             "date",
             "fetched_at",
+            "updated_at",
         ]
-        read_only_fields = ["id", "fetched_at"]
+        read_only_fields = ["id", "fetched_at", "updated_at"]
+
+
+class LatestExchangeRateSerializer(serializers.ModelSerializer):
+    """통화별 최신 환율 Serializer"""
+
+    class Meta:
+        model = LatestExchangeRate
+        fields = [
+            "code",
+            "name",
+            "base_rate",
+            "cash_buy_rate",
+            "cash_sell_rate",
+            "remit_send_rate",
+            "remit_receive_rate",
+            "date",
+            "updated_at",
+        ]
+        read_only_fields = fields
@@ -3,17 +3,39 @@
 """
 
 import logging
+from collections.abc import Iterable
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
+from functools import partial
 from typing import Any
 
 import requests
+from asgiref.sync import sync_to_async
 from django.conf import settings
-
-from .models import ExchangeRate
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q, QuerySet
+from django.utils import timezone
+
+from .decoder import DecodedRates, adecode_stream, decode_items, decode_stream, fingerprint_items
+from .models import (
+    RATE_VALUE_FIELDS,
+    ExchangeRate,
+    ExchangeRatePayload,
+    ExchangeRateRevision,
+    LatestExchangeRate,
+    RenderedDocument,
+)
+from .partitioning import ensure_partitions
+from .snapshots import latest_rates_cache
 
 logger = logging.getLogger(__name__)
 
+# 수출입은행 API 호출 타임아웃 (초)
+REQUEST_TIMEOUT = 30
+
+# 응답 본문 스트리밍 청크 크기 (bytes)
+STREAM_CHUNK_SIZE = 8192
+
 
 class KoreaEximAPIError(Exception):
     """수출입은행 API 호출 오류"""
@@ -22,7 +44,11 @@ class KoreaEximAPIError(Exception):
 
 
 def parse_rate(value: str | None) -> Decimal | None:
-    """환율 문자열을 Decimal로 변환 (쉼표 제거)"""
+    """
+    환율 문자열을 Decimal로 변환 (쉼표 제거)
+
+    레거시: 저장 경로는 decoder가 값을 검증/변환하므로 사용하지 않으며, 호환을 위해서만 남겨 둡니다.
+    """
     if not value:
         return None
     try:
@@ -32,9 +58,39 @@ def parse_rate(value: str | None) -> Decimal | None:
         return None
 
 
+def _build_params(search_date: date) -> dict[str, str]:
+    """API 요청 파라미터 생성 (API 키 검증 포함)"""
+    api_key = settings.KOREAEXIM_API_KEY
+    if not api_key:
+        raise KoreaEximAPIError("KOREAEXIM_API_KEY가 설정되지 않았습니다.")
+
+    return {
+        "authkey": api_key,
+        "searchdate": search_date.strftime("%Y%m%d"),
+        "data": "AP01",  # 환율 데이터
+    }
+
+
+def _check_response_data(data: Any, search_date: date) -> list[dict[str, Any]]:
+    """API 응답 본문 검증 (동기/비동기 클라이언트 공용)"""
+    # API 응답이 빈 리스트인 경우 (주말/공휴일 등)
+    if not data:
+        logger.info(f"{search_date} 환율 데이터가 없습니다 (주말/공휴일 가능성)")
+        return []
+
+    # API 에러 응답 확인
+    if isinstance(data, dict) and data.get("result") == 0:
+        raise KoreaEximAPIError(f"API 오류: {data}")
+
+    return data
+
+
 def fetch_exchange_rates(search_date: date | None = None) -> list[dict[str, Any]]:
     """
-    수출입은행 API에서 환율 데이터를 가져옵니다.
+    수출입은행 API에서 환율 데이터를 가져옵니다 (응답 원본 list).
+
+    레거시: 저장 경로(save_exchange_rates)는 응답을 스트리밍 디코딩하는 fetch_decoded_rates를 사용하며,
+    이 함수는 원본 항목이 필요한 호출자와의 호환을 위해서만 남겨 둡니다.
 
     Args:
         search_date: 조회할 날짜 (기본값: 오늘)
@@ -45,37 +101,434 @@ def fetch_exchange_rates(search_date: date | None = None) -> list[dict[str, Any]
     Raises:
         KoreaEximAPIError: API 호출 실패 시
     """
-    api_key = settings.KOREAEXIM_API_KEY
-    if not api_key:
-        raise KoreaEximAPIError("KOREAEXIM_API_KEY가 설정되지 않았습니다.")
-
     if search_date is None:
         search_date = date.today()
 
-    params = {
-        "authkey": api_key,
-        "searchdate": search_date.strftime("%Y%m%d"),
-        "data": "AP01",  # 환율 데이터
-    }
+    params = _build_params(search_date)
 
     try:
-        response = requests.get(settings.KOREAEXIM_API_URL, params=params, timeout=30)
+        response = requests.get(settings.KOREAEXIM_API_URL, params=params, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
     except requests.RequestException as e:
         raise KoreaEximAPIError(f"API 호출 실패: {e}") from e
 
-    data = response.json()
+    return _check_response_data(response.json(), search_date)
 
-    # API 응답이 빈 리스트인 경우 (주말/공휴일 등)
-    if not data:
+
+async def afetch_exchange_rates(search_date: date | None = None, client=None) -> list[dict[str, Any]]:
+    """
+    fetch_exchange_rates의 비동기 버전 (httpx 사용).
+
+    ASGI 환경에서 최대 30초가 걸리는 API 호출 동안 워커를 점유하지 않습니다.
+    레거시: 저장 경로(asave_exchange_rates, 수집 파이프라인)는 afetch_decoded_rates를 사용합니다.
+
+    Args:
+        search_date: 조회할 날짜 (기본값: 오늘)
+        client: 재사용할 httpx.AsyncClient (기본값: 호출마다 새로 생성)
+
+    Raises:
+        KoreaEximAPIError: API 호출 실패 시
+    """
+    if search_date is None:
+        search_date = date.today()
+
+    # httpx는 비동기 경로에서만 필요하므로 지연 import (수집 전용 실행 시 기동 시간 단축)
+    import httpx
+
+    params = _build_params(search_date)
+
+    try:
+        if client is None:
+            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+                response = await client.get(settings.KOREAEXIM_API_URL, params=params)
+        else:
+            response = await client.get(settings.KOREAEXIM_API_URL, params=params, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        raise KoreaEximAPIError(f"API 호출 실패: {e}") from e
+
+    return _check_response_data(response.json(), search_date)
+
+
+def _check_decoded(decoded: DecodedRates, search_date: date) -> DecodedRates:
+    """스트리밍 디코딩 결과 검증 (_check_response_data와 같은 기준)"""
+    if decoded.error:
+        raise KoreaEximAPIError(f"API 오류: {decoded.error}")
+    if not decoded.item_count:
         logger.info(f"{search_date} 환율 데이터가 없습니다 (주말/공휴일 가능성)")
-        return []
+    return decoded
 
-    # API 에러 응답 확인
-    if isinstance(data, dict) and data.get("result") == 0:
-        raise KoreaEximAPIError(f"API 오류: {data}")
 
-    return data
+def fetch_decoded_rates(search_date: date | None = None) -> DecodedRates:
+    """
+    수출입은행 API 응답 본문을 받는 대로 디코딩합니다 (stream=True).
+
+    레거시 fetch_exchange_rates와 달리 응답 전체를 list로 만든 뒤 다시 순회하지 않고,
+    청크 단위로 JSON 파싱/검증/지문 계산을 한 번에 수행합니다.
+
+    Raises:
+        KoreaEximAPIError: API 호출 실패, 오류 응답 또는 JSON 형식 오류 시
+    """
+    if search_date is None:
+        search_date = date.today()
+
+    params = _build_params(search_date)
+
+    try:
+        with requests.get(settings.KOREAEXIM_API_URL, params=params, timeout=REQUEST_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            decoded = decode_stream(response.iter_content(chunk_size=STREAM_CHUNK_SIZE))
+    except requests.RequestException as e:
+        raise KoreaEximAPIError(f"API 호출 실패: {e}") from e
+    except ValueError as e:
+        raise KoreaEximAPIError(f"API 응답 형식 오류: {e}") from e
+
+    return _check_decoded(decoded, search_date)
+
+
+async def afetch_decoded_rates(search_date: date | None = None, client=None) -> DecodedRates:
+    """
+    fetch_decoded_rates의 비동기 버전 (httpx 스트리밍 응답).
+
+    Args:
+        search_date: 조회할 날짜 (기본값: 오늘)
+        client: 재사용할 httpx.AsyncClient (기본값: 호출마다 새로 생성)
+
+    Raises:
+        KoreaEximAPIError: API 호출 실패, 오류 응답 또는 JSON 형식 오류 시
+    """
+    if search_date is None:
+        search_date = date.today()
+
+    # httpx는 비동기 경로에서만 필요하므로 지연 import
+    import httpx
+
+    params = _build_params(search_date)
+
+    async def stream(client: httpx.AsyncClient) -> DecodedRates:
+        async with client.stream("GET", settings.KOREAEXIM_API_URL, params=params, timeout=REQUEST_TIMEOUT) as response:
+            response.raise_for_status()
+            return await adecode_stream(response.aiter_bytes(STREAM_CHUNK_SIZE))
+
+    try:
+        if client is None:
+            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+                decoded = await stream(client)
+        else:
+            decoded = await stream(client)
+    except httpx.HTTPError as e:
+        raise KoreaEximAPIError(f"API 호출 실패: {e}") from e
+    except ValueError as e:
+        raise KoreaEximAPIError(f"API 응답 형식 오류: {e}") from e
+
+    return _check_decoded(decoded, search_date)
+
+
+def payload_fingerprint(data: list[dict[str, Any]]) -> str:
+    """API 원본 응답의 SHA-256 지문 (항목 내 키 순서와 무관)"""
+    return fingerprint_items(data)
+
+
+def store_exchange_rates(data: list[dict[str, Any]], search_date: date) -> int:
+    """
+    API 응답 데이터를 DB에 저장합니다.
+
+    Args:
+        data: fetch_exchange_rates 응답 데이터
+        search_date: 고시일
+
+    Returns:
+        새로 생성되거나 정정된 환율 데이터 개수
+    """
+    return store_decoded_rates(decode_items(data), search_date)
+
+
+def replay_exchange_rates(chunks: Iterable[bytes], search_date: date) -> int:
+    """
+    저장해 둔 API 원본 응답(청크 스트림)을 다시 디코딩해 저장합니다 (일괄 재처리용).
+
+    Raises:
+        KoreaEximAPIError: 원본이 API 오류 응답인 경우
+    """
+    decoded = decode_stream(chunks)
+    if decoded.error is not None:
+        raise KoreaEximAPIError(f"API 오류: {decoded.error}")
+    if not decoded.item_count:
+        return 0
+    return store_decoded_rates(decoded, search_date)
+
+
+def supersede(rate: ExchangeRate, now: datetime) -> ExchangeRateRevision:
+    """저장되어 있던 값을 [updated_at, now) 구간의 정정 이력으로 (저장은 호출하는 쪽에서)"""
+    return ExchangeRateRevision(
+        code=rate.code,
+        date=rate.date,
+        valid_from=rate.updated_at,
+        superseded_at=now,
+        **{field: getattr(rate, field) for field in RATE_VALUE_FIELDS},
+    )
+
+
+def store_decoded_rates(decoded: DecodedRates, search_date: date) -> int:
+    """
+    디코딩된 환율을 DB에 저장합니다.
+
+    원본 응답 지문이 이전 수집과 같으면 아무 행도 건드리지 않습니다.
+    값이 정정된 통화만 갱신하고, 대체된 이전 값은 ExchangeRateRevision에 남깁니다.
+
+    Returns:
+        새로 생성되거나 정정된 환율 데이터 개수
+    """
+    for anomaly in decoded.anomalies:
+        logger.warning(
+            f"{search_date} 환율 응답 이상: #{anomaly.index} {anomaly.code or '-'} "
+            f"{anomaly.field}={anomaly.value!r} ({anomaly.reason}{', 항목 제외' if anomaly.dropped else ''})",
+            extra={"anomaly": anomaly, "search_date": search_date},
+        )
+
+    fingerprint = decoded.fingerprint
+    parsed = {record.code: record.values() for record in decoded.records}
+
+    now = timezone.now()
+    created: list[ExchangeRate] = []
+    revised: list[ExchangeRate] = []
+    revisions: list[ExchangeRateRevision] = []
+
+    # 트랜잭션 안의 읽기는 replica가 설정되어 있어도 primary에서 수행됨 (config.db_router)
+    with transaction.atomic():
+        if ExchangeRatePayload.objects.filter(date=search_date, fingerprint=fingerprint).exists():
+            logger.info(f"{search_date} 환율 원본 변경 없음 - 저장 건너뜀")
+            return 0
+
+        # 파티션 저장소(PostgreSQL)이면 고시일 연도 파티션을 준비 (그 외에는 아무것도 하지 않음)
+        ensure_partitions([search_date])
+
+        existing = {
+            rate.code: rate
+            for rate in ExchangeRate.objects.select_for_update().filter(date=search_date, code__in=parsed)
+        }
+
+        for code, values in parsed.items():
+            exchange_rate = existing.get(code)
+            if exchange_rate is None:
+                created.append(ExchangeRate(code=code, date=search_date, updated_at=now, **values))
+                continue
+
+            if all(getattr(exchange_rate, field) == value for field, value in values.items()):
+                continue
+
+            # 정정된 통화: 이전 값을 이력으로 남기고 갱신
+            revisions.append(supersede(exchange_rate, now))
+            for field, value in values.items():
+                setattr(exchange_rate, field, value)
+            exchange_rate.updated_at = now
+            revised.append(exchange_rate)
+
+        ExchangeRate.objects.bulk_create(created)
+        ExchangeRate.objects.bulk_update(revised, [*RATE_VALUE_FIELDS, "updated_at"])
+        ExchangeRateRevision.objects.bulk_create(revisions)
+        update_latest_rates([*created, *revised])
+        ExchangeRatePayload.objects.update_or_create(
+            date=search_date,
+            defaults={"fingerprint": fingerprint, "item_count": decoded.item_count},
+        )
+        if created or revised:
+            invalidate_documents([search_date])
+
+    unchanged_count = len(parsed) - len(created) - len(revised)
+    logger.info(
+        f"{search_date} 환율 데이터 저장 완료: 생성 {len(created)}건, 정정 {len(revised)}건, 변경 없음 {unchanged_count}건"
+    )
+    return len(created) + len(revised)
+
+
+def _snapshot(rate: ExchangeRate) -> LatestExchangeRate:
+    return LatestExchangeRate(
+        code=rate.code,
+        date=rate.date,
+        updated_at=rate.updated_at,
+        **{field: getattr(rate, field) for field in RATE_VALUE_FIELDS},
+    )
+
+
+def _upsert_snapshot(snapshot: list[LatestExchangeRate]) -> None:
+    LatestExchangeRate.objects.bulk_create(
+        snapshot,
+        update_conflicts=True,
+        unique_fields=["code"],
+        update_fields=[*RATE_VALUE_FIELDS, "date", "updated_at"],
+    )
+
+
+def update_latest_rates(rates: list[ExchangeRate]) -> int:
+    """
+    새로 저장/정정된 환율로 통화별 최신 스냅샷을 갱신합니다.
+
+    store_exchange_rates의 트랜잭션 안에서 호출되며, 스냅샷보다 과거 고시일의
+    데이터(과거 날짜 재수집)는 스냅샷을 바꾸지 않습니다.
+
+    Returns:
+        갱신된 스냅샷 행 개수
+    """
+    if not rates:
+        return 0
+
+    current = {
+        latest.code: latest.date
+        for latest in LatestExchangeRate.objects.select_for_update().filter(code__in={rate.code for rate in rates})
+    }
+    snapshot = [_snapshot(rate) for rate in rates if rate.code not in current or rate.date >= current[rate.code]]
+    if not snapshot:
+        return 0
+
+    _upsert_snapshot(snapshot)
+    transaction.on_commit(latest_rates_cache.invalidate)
+    return len(snapshot)
+
+
+def refresh_latest_rates(codes: Iterable[str]) -> int:
+    """
+    통화별 최신 스냅샷을 이력 테이블에서 다시 계산합니다 (관리자 수정/삭제용).
+
+    update_latest_rates와 달리 현재 스냅샷 날짜와 관계없이 덮어쓰므로, 최신 고시일 행이
+    삭제되면 그 이전 고시일 값으로 돌아가고 남은 행이 없는 통화는 스냅샷에서 지워집니다.
+    환율을 바꾸는 트랜잭션 안에서 호출합니다.
+
+    Returns:
+        갱신된 스냅샷 행 개수
+    """
+    codes = set(codes)
+    # 같은 통화를 갱신하는 수집과 직렬화
+    list(LatestExchangeRate.objects.select_for_update().filter(code__in=codes))
+    latest = [ExchangeRate.objects.filter(code=code).order_by("-date").first() for code in sorted(codes)]
+    snapshot = [_snapshot(rate) for rate in latest if rate is not None]
+
+    LatestExchangeRate.objects.filter(code__in=codes - {row.code for row in snapshot}).delete()
+    _upsert_snapshot(snapshot)
+    transaction.on_commit(latest_rates_cache.invalidate)
+    return len(snapshot)
+
+
+def save_rate_change(rate: ExchangeRate) -> None:
+    """
+    관리자에서 추가/수정한 환율을 저장합니다.
+
+    수집과 같은 정정 이력 경로를 사용합니다. 값이 바뀌었으면 이전 값을 [updated_at, 지금) 이력으로
+    닫고 updated_at을 지금으로 옮겨, as_of 조회가 수정 전 시점에는 이전 값을 돌려주도록 합니다.
+    통화 코드/고시일은 이력의 키이므로 수정하지 않는다고 가정합니다 (관리자에서 읽기 전용).
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        stored = ExchangeRate.objects.select_for_update().filter(pk=rate.pk).first() if rate.pk else None
+        if stored is None:
+            rate.updated_at = now
+        elif any(getattr(stored, field) != getattr(rate, field) for field in RATE_VALUE_FIELDS):
+            supersede(stored, now).save()
+            rate.updated_at = now
+        rate.save()
+        refresh_latest_rates([rate.code])
+        invalidate_documents([rate.date])
+
+
+def delete_rates(rates: Iterable[ExchangeRate]) -> int:
+    """
+    관리자에서 선택한 환율을 삭제합니다.
+
+    삭제 전 값을 [updated_at, 지금) 정정 이력으로 닫아 두므로, 같은 통화/고시일이 다시 수집되면
+    as_of 조회가 삭제 전 시점에는 삭제된 값을, 삭제 후 재수집 전 시점에는 빈 결과를 돌려줍니다.
+
+    Returns:
+        삭제된 환율 개수
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        locked = list(ExchangeRate.objects.select_for_update().filter(pk__in=[rate.pk for rate in rates]))
+        ExchangeRateRevision.objects.bulk_create(supersede(rate, now) for rate in locked)
+        ExchangeRate.objects.filter(pk__in=[rate.pk for rate in locked]).delete()
+        refresh_latest_rates({rate.code for rate in locked})
+        invalidate_documents({rate.date for rate in locked})
+    return len(locked)
+
+
+def invalidate_documents(dates: Iterable[date]) -> int:
+    """
+    고시일의 사전 렌더링 문서를 삭제하고 커밋 후 다시 렌더링하도록 등록합니다.
+
+    환율을 바꾸는 트랜잭션 안에서 호출합니다. 삭제가 같은 트랜잭션으로 커밋되므로
+    렌더링이 끝나기 전(또는 실패한 경우)에는 조회가 DB 동적 경로로 응답하고,
+    이전 값으로 렌더링된 문서가 유효한 ETag로 계속 응답되지 않습니다.
+
+    Returns:
+        삭제된 문서 개수
+    """
+    dates = set(dates)
+    deleted, _ = RenderedDocument.objects.filter(date__in=dates).delete()
+    for rate_date in sorted(dates):
+        transaction.on_commit(partial(render_documents, rate_date), robust=True)
+    return deleted
+
+
+def render_documents(search_date: date) -> int:
+    """
+    고시일의 사전 렌더링 조회 문서를 갱신합니다 (store_exchange_rates 커밋 직후 호출).
+
+    DRF 렌더링은 이 시점에만 필요하므로 지연 import 합니다.
+    """
+    from .documents import render_daily_documents
+
+    count = render_daily_documents(search_date)
+    logger.info(f"{search_date} 조회 문서 {count}건 렌더링 완료")
+    return count
+
+
+def known_as_of(queryset: QuerySet, known_at: datetime) -> QuerySet:
+    """
+    queryset에서 known_at 시점에 이미 수집되어 있던 행만 남깁니다 (쿼리셋 그대로 반환).
+
+    현재 값이 known_at 이전에 반영되었거나, known_at 이전부터 유효했던 이전 값(정정 이력)이 있는 행입니다.
+    값 자체는 바꾸지 않으므로 페이지네이션 뒤 해당 페이지에 rates_as_of를 적용합니다.
+    """
+    earlier_revisions = ExchangeRateRevision.objects.filter(
+        code=OuterRef("code"), date=OuterRef("date"), valid_from__lte=known_at
+    )
+    return queryset.filter(Q(updated_at__lte=known_at) | Exists(earlier_revisions))
+
+
+def rates_as_of(rates: QuerySet | Iterable[ExchangeRate], known_at: datetime) -> list[ExchangeRate]:
+    """
+    환율을 known_at 시점에 알려져 있던 값으로 반환합니다.
+
+    known_at 이후 정정된 행은 당시 값으로 되돌리고,
+    known_at 이후에 처음 수집된 행은 결과에서 제외합니다.
+    쿼리셋 전체가 아니라 조회할 행(페이지 등)에만 적용하세요.
+    """
+    # QuerySet 결과 캐시의 인스턴스를 바꾸지 않도록 새로 조회
+    rates = list(rates.all() if isinstance(rates, QuerySet) else rates)
+    stale = [rate for rate in rates if rate.updated_at > known_at]
+    if not stale:
+        return rates
+
+    revisions = {
+        (revision.code, revision.date): revision
+        for revision in ExchangeRateRevision.objects.filter(
+            code__in={rate.code for rate in stale},
+            date__in={rate.date for rate in stale},
+            valid_from__lte=known_at,
+            superseded_at__gt=known_at,
+        )
+    }
+
+    result = []
+    for rate in rates:
+        if rate.updated_at > known_at:
+            revision = revisions.get((rate.code, rate.date))
+            if revision is None:
+                continue  # known_at 시점에는 아직 수집되지 않은 값
+            for field in RATE_VALUE_FIELDS:
+                setattr(rate, field, getattr(revision, field))
+            rate.updated_at = revision.valid_from
+        result.append(rate)
+    return result
 
 
 def save_exchange_rates(search_date: date | None = None) -> int:
@@ -91,35 +544,26 @@ def save_exchange_rates(search_date: date | None = None) -> int:
     if search_date is None:
         search_date = date.today()
 
-    data = fetch_exchange_rates(search_date)
+    decoded = fetch_decoded_rates(search_date)
 
-    if not data:
+    if not decoded.item_count:
         return 0
 
-    saved_count = 0
+    return store_decoded_rates(decoded, search_date)
 
-    for item in data:
-        code = item.get("cur_unit", "").strip()
-        if not code:
-            continue
 
-        # 기존 데이터가 있으면 업데이트, 없으면 생성
-        exchange_rate, created = ExchangeRate.objects.update_or_create(
-            code=code,
-            date=search_date,
-            defaults={
-                "name": item.get("cur_nm", ""),
-                "base_rate": parse_rate(item.get("deal_bas_r")),
-                "cash_buy_rate": parse_rate(item.get("bkpr")),
-                "cash_sell_rate": parse_rate(item.get("kftc_bkpr")),
-                "remit_send_rate": parse_rate(item.get("tts")),
-                "remit_receive_rate": parse_rate(item.get("ttb")),
-            },
-        )
+async def asave_exchange_rates(search_date: date | None = None) -> int:
+    """
+    save_exchange_rates의 비동기 버전.
 
-        action = "생성" if created else "업데이트"
-        logger.debug(f"{code} {search_date} 환율 {action}: {exchange_rate.base_rate}")
-        saved_count += 1
+    API 호출은 httpx로 이벤트 루프에서 처리하고, DB 저장만 스레드에서 실행합니다.
+    """
+    if search_date is None:
+        search_date = date.today()
+
+    decoded = await afetch_decoded_rates(search_date)
+
+    if not decoded.item_count:
+        return 0
 
-    logger.info(f"{search_date} 환율 데이터 {saved_count}건 저장 완료")
-    return saved_count
+    return await sync_to_async(store_decoded_rates)(decoded, search_date)
@@ -0,0 +1,52 @@
+"""
+조회용 스냅샷의 프로세스 로컬 캐시
+"""
+
+import threading
+import time
+from typing import Any
+
+from django.conf import settings
+
+
+class ProcessLocalCache:
+    """
+    프로세스 로컬 캐시
+
+    같은 프로세스의 수집은 커밋 직후 invalidate()로 즉시 반영되고,
+    다른 프로세스(cron 수집 컨테이너 등)의 수집은 최대 ttl초 후 반영됩니다.
+    """
+
+    def __init__(self, ttl_setting: str):
+        self.ttl_setting = ttl_setting
+        self._value: Any = None
+        self._expires_at = 0.0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """값을 읽어오기 전에 확인해 set()에 넘기는 무효화 세대 번호"""
+        return self._generation
+
+    def get(self) -> Any | None:
+        if self._value is not None and time.monotonic() < self._expires_at:
+            return self._value
+        return None
+
+    def set(self, value: Any, generation: int) -> None:
+        """읽는 도중 무효화가 일어났다면 (이전 값일 수 있으므로) 저장하지 않음"""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._value = value
+            self._expires_at = time.monotonic() + getattr(settings, self.ttl_setting)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._value = None
+
+
+# GET /api/exchange-rates/latest/ 응답 데이터
+latest_rates_cache = ProcessLocalCache("LATEST_RATES_CACHE_TTL")
@@ -2,18 +2,30 @@
 환율 앱 테스트
 """
 
-from datetime import date
+import json
+from datetime import date, timedelta
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
 
-from apps.exchange_rates.models import ExchangeRate
+from apps.exchange_rates.decoder import decode_items, decode_stream, normalize_code
+from apps.exchange_rates.models import ExchangeRate, ExchangeRatePayload, ExchangeRateRevision, LatestExchangeRate
 from apps.exchange_rates.services import (
     KoreaEximAPIError,
+    afetch_decoded_rates,
+    afetch_exchange_rates,
+    asave_exchange_rates,
+    fetch_decoded_rates,
     fetch_exchange_rates,
     parse_rate,
+    payload_fingerprint,
+    rates_as_of,
+    replay_exchange_rates,
     save_exchange_rates,
+    store_exchange_rates,
+    update_latest_rates,
 )
 
 
@@ -134,33 +146,132 @@ class FetchExchangeRatesTestCase(TestCase):
 
         self.assertEqual(result, [])
 
+    @patch("apps.exchange_rates.services.requests.get")
+    def test_fetch_decoded_stream(self, mock_get):
+        """응답 본문을 청크 단위로 받아 디코딩"""
+        body = json.dumps([{"cur_unit": "USD", "cur_nm": "미국 달러", "deal_bas_r": "1,432.50"}]).encode()
+        mock_response = mock_get.return_value.__enter__.return_value
+        mock_response.iter_content.return_value = [body[i : i + 5] for i in range(0, len(body), 5)]
+
+        with self.settings(KOREAEXIM_API_KEY="test_key"):
+            decoded = fetch_decoded_rates(date(2024, 1, 15))
+
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+        self.assertEqual(decoded.records[0].base_rate, Decimal("1432.50"))
+        self.assertEqual(decoded.fingerprint, payload_fingerprint(json.loads(body)))
+
+        mock_response.iter_content.return_value = [b'{"result": 0}']
+        with self.settings(KOREAEXIM_API_KEY="test_key"):
+            with self.assertRaises(KoreaEximAPIError):
+                fetch_decoded_rates(date(2024, 1, 15))
+
+        mock_response.iter_content.return_value = [b'[{"cur_unit": "USD"']
+        with self.settings(KOREAEXIM_API_KEY="test_key"):
+            with self.assertRaises(KoreaEximAPIError):
+                fetch_decoded_rates(date(2024, 1, 15))
+
+
+class AsyncFetchExchangeRatesTestCase(TestCase):
+    """비동기 API 호출 테스트"""
+
+    def _mock_async_client(self, mock_client_class, payload):
+        mock_response = MagicMock()
+        mock_response.json.return_value = payload
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+        mock_client_class.return_value.__aenter__.return_value = mock_client
+        return mock_client
+
+    async def test_afetch_without_api_key(self):
+        """API 키 없이 호출 시 에러"""
+        with self.settings(KOREAEXIM_API_KEY=""):
+            with self.assertRaises(KoreaEximAPIError):
+                await afetch_exchange_rates()
+
+    @patch("httpx.AsyncClient")
+    async def test_afetch_success(self, mock_client_class):
+        """비동기 API 호출 성공 테스트"""
+        mock_client = self._mock_async_client(
+            mock_client_class, [{"cur_unit": "USD", "cur_nm": "미국 달러", "deal_bas_r": "1,432.50"}]
+        )
+
+        with self.settings(KOREAEXIM_API_KEY="test_key"):
+            result = await afetch_exchange_rates(date(2024, 1, 15))
+
+        self.assertEqual(result[0]["cur_unit"], "USD")
+        self.assertEqual(mock_client.get.call_args.kwargs["params"]["searchdate"], "20240115")
+
+    @patch("httpx.AsyncClient")
+    async def test_afetch_api_error(self, mock_client_class):
+        """API 에러 응답 테스트"""
+        self._mock_async_client(mock_client_class, {"result": 0})
+
+        with self.settings(KOREAEXIM_API_KEY="test_key"):
+            with self.assertRaises(KoreaEximAPIError):
+                await afetch_exchange_rates(date(2024, 1, 15))
+
+    @patch("httpx.AsyncClient")
+    async def test_afetch_decoded_stream(self, mock_client_class):
+        """비동기 스트리밍 응답 디코딩"""
+        body = json.dumps([{"cur_unit": "USD", "cur_nm": "미국 달러", "deal_bas_r": "1,432.50"}]).encode()
+
+        async def aiter_bytes(chunk_size=None):
+            for i in range(0, len(body), 5):
+                yield body[i : i + 5]
+
+        mock_response = MagicMock()
+        mock_response.aiter_bytes = aiter_bytes
+        mock_client = MagicMock()
+        mock_client.stream.return_value.__aenter__.return_value = mock_response
+        mock_client_class.return_value.__aenter__.return_value = mock_client
+
+        with self.settings(KOREAEXIM_API_KEY="test_key"):
+            decoded = await afetch_decoded_rates(date(2024, 1, 15))
+
+        self.assertEqual(mock_client.stream.call_args.kwargs["params"]["searchdate"], "20240115")
+        self.assertEqual(decoded.records[0].base_rate, Decimal("1432.50"))
+        self.assertEqual(decoded.item_count, 1)
+
+    @patch("apps.exchange_rates.services.afetch_decoded_rates")
+    async def test_asave_exchange_rates(self, mock_fetch):
+        """비동기 환율 저장 테스트"""
+        mock_fetch.return_value = decode_items([{"cur_unit": "USD", "cur_nm": "미국 달러", "deal_bas_r": "1,432.50"}])
+
+        count = await asave_exchange_rates(date(2024, 1, 15))
+
+        self.assertEqual(count, 1)
+        usd = await ExchangeRate.objects.aget(code="USD", date=date(2024, 1, 15))
+        self.assertEqual(usd.base_rate, Decimal("1432.50"))
+
 
 class SaveExchangeRatesTestCase(TestCase):
     """환율 저장 테스트"""
 
-    @patch("apps.exchange_rates.services.fetch_exchange_rates")
+    @patch("apps.exchange_rates.services.fetch_decoded_rates")
     def test_save_exchange_rates(self, mock_fetch):
         """환율 저장 테스트"""
-        mock_fetch.return_value = [
-            {
-                "cur_unit": "USD",
-                "cur_nm": "미국 달러",
-                "deal_bas_r": "1,432.50",
-                "bkpr": "1,460.00",
-                "kftc_bkpr": "1,405.00",
-                "tts": "1,447.00",
-                "ttb": "1,418.00",
-            },
-            {
-                "cur_unit": "EUR",
-                "cur_nm": "유로",
-                "deal_bas_r": "1,550.00",
-                "bkpr": "1,580.00",
-                "kftc_bkpr": "1,520.00",
-                "tts": "1,565.00",
-                "ttb": "1,535.00",
-            },
-        ]
+        mock_fetch.return_value = decode_items(
+            [
+                {
+                    "cur_unit": "USD",
+                    "cur_nm": "미국 달러",
+                    "deal_bas_r": "1,432.50",
+                    "bkpr": "1,460.00",
+                    "kftc_bkpr": "1,405.00",
+                    "tts": "1,447.00",
+                    "ttb": "1,418.00",
+                },
+                {
+                    "cur_unit": "EUR",
+                    "cur_nm": "유로",
+                    "deal_bas_r": "1,550.00",
+                    "bkpr": "1,580.00",
+                    "kftc_bkpr": "1,520.00",
+                    "tts": "1,565.00",
+                    "ttb": "1,535.00",
+                },
+            ]
+        )
 
         count = save_exchange_rates(date(2024, 1, 15))
 
@@ -171,7 +282,7 @@ class SaveExchangeRatesTestCase(TestCase):
         self.assertEqual(usd.name, "미국 달러")
         self.assertEqual(usd.base_rate, Decimal("1432.50"))
 
-    @patch("apps.exchange_rates.services.fetch_exchange_rates")
+    @patch("apps.exchange_rates.services.fetch_decoded_rates")
     def test_save_updates_existing(self, mock_fetch):
         """기존 데이터 업데이트 테스트"""
         # 기존 데이터 생성
@@ -182,13 +293,15 @@ class SaveExchangeRatesTestCase(TestCase):
             date=date(2024, 1, 15),
         )
 
-        mock_fetch.return_value = [
-            {
-                "cur_unit": "USD",
-                "cur_nm": "미국 달러",
-                "deal_bas_r": "1,432.50",
-            },
-        ]
+        mock_fetch.return_value = decode_items(
+            [
+                {
+                    "cur_unit": "USD",
+                    "cur_nm": "미국 달러",
+                    "deal_bas_r": "1,432.50",
+                },
+            ]
+        )
 
         count = save_exchange_rates(date(2024, 1, 15))
 
@@ -199,6 +312,735 @@ class SaveExchangeRatesTestCase(TestCase):
         self.assertEqual(usd.base_rate, Decimal("1432.50"))  # 업데이트됨
 
 
+class RateRevisionTestCase(TestCase):
+    """원본 지문 및 정정 이력 테스트"""
+
+    PAYLOAD = [
+        {"cur_unit": "USD", "cur_nm": "미국 달러", "deal_bas_r": "1,432.50"},
+        {"cur_unit": "EUR", "cur_nm": "유로", "deal_bas_r": "1,550.00"},
+    ]
+
+    def test_payload_fingerprint_ignores_key_order(self):
+        """항목 내 키 순서와 무관한 지문"""
+        reordered = [dict(reversed(list(item.items()))) for item in self.PAYLOAD]
+        self.assertEqual(payload_fingerprint(self.PAYLOAD), payload_fingerprint(reordered))
+
+    @patch("apps.exchange_rates.services.fetch_decoded_rates")
+    def test_unchanged_payload_skipped(self, mock_fetch):
+        """동일 원본 재수집 시 쓰기 없음"""
+        mock_fetch.return_value = decode_items(self.PAYLOAD)
+        self.assertEqual(save_exchange_rates(date(2024, 1, 15)), 2)
+        updated_at = ExchangeRate.objects.get(code="USD").updated_at
+
+        with self.assertNumQueries(3):  # SAVEPOINT, 지문 조회, RELEASE SAVEPOINT
+            self.assertEqual(save_exchange_rates(date(2024, 1, 15)), 0)
+        self.assertEqual(ExchangeRate.objects.get(code="USD").updated_at, updated_at)
+        self.assertEqual(ExchangeRatePayload.objects.get(date=date(2024, 1, 15)).item_count, 2)
+
+    @patch("apps.exchange_rates.services.fetch_decoded_rates")
+    def test_revision_only_changed_currency(self, mock_fetch):
+        """정정된 통화만 갱신하고 이전 값은 이력으로 보관"""
+        mock_fetch.return_value = decode_items(self.PAYLOAD)
+        save_exchange_rates(date(2024, 1, 15))
+        eur_updated_at = ExchangeRate.objects.get(code="EUR").updated_at
+
+        mock_fetch.return_value = decode_items([self.PAYLOAD[0] | {"deal_bas_r": "1,433.00"}, self.PAYLOAD[1]])
+        self.assertEqual(save_exchange_rates(date(2024, 1, 15)), 1)
+
+        usd = ExchangeRate.objects.get(code="USD")
+        self.assertEqual(usd.base_rate, Decimal("1433.00"))
+        self.assertEqual(ExchangeRate.objects.get(code="EUR").updated_at, eur_updated_at)
+
+        revision = ExchangeRateRevision.objects.get()
+        self.assertEqual(revision.code, "USD")
+        self.assertEqual(revision.base_rate, Decimal("1432.50"))
+        self.assertEqual(revision.superseded_at, usd.updated_at)
+
+    @patch("apps.exchange_rates.services.fetch_decoded_rates")
+    def test_rates_as_of(self, mock_fetch):
+        """특정 시점 기준 환율 조회"""
+        mock_fetch.return_value = decode_items(self.PAYLOAD)
+        save_exchange_rates(date(2024, 1, 15))
+        first_known = ExchangeRate.objects.get(code="USD").updated_at
+
+        mock_fetch.return_value = decode_items([self.PAYLOAD[0] | {"deal_bas_r": "1,433.00"}])
+        save_exchange_rates(date(2024, 1, 15))
+        queryset = ExchangeRate.objects.filter(code="USD")
+
+        self.assertEqual(rates_as_of(queryset, first_known)[0].base_rate, Decimal("1432.50"))
+        self.assertEqual(rates_as_of(queryset, timezone.now())[0].base_rate, Decimal("1433.00"))
+        self.assertEqual(rates_as_of(queryset, first_known - timedelta(seconds=1)), [])
+
+    @patch("apps.exchange_rates.services.fetch_decoded_rates")
+    def test_as_of_endpoint(self, mock_fetch):
+        """as_of 파라미터 조회 테스트"""
+        from django.test import Client
+
+        mock_fetch.return_value = decode_items(self.PAYLOAD)
+        save_exchange_rates(date(2024, 1, 15))
+        first_known = ExchangeRate.objects.get(code="USD").updated_at
+        mock_fetch.return_value = decode_items([self.PAYLOAD[0] | {"deal_bas_r": "1,433.00"}])
+        save_exchange_rates(date(2024, 1, 15))
+
+        client = Client()
+        response = client.get("/api/exchange-rates/USD/dates/2024-01-15/", {"as_of": first_known.isoformat()})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["base_rate"], "1432.5000")
+
+        response = client.get("/api/exchange-rates/", {"as_of": first_known.isoformat(), "code": "USD"})
+        self.assertEqual([rate["base_rate"] for rate in response.json()["results"]], ["1432.5000"])
+        response = client.get("/api/exchange-rates/", {"as_of": (first_known - timedelta(seconds=1)).isoformat()})
+        self.assertEqual(response.json()["count"], 0)
+
+        response = client.get("/api/exchange-rates/USD/", {"as_of": "not-a-date"})
+        self.assertEqual(response.status_code, 400)
+
+    @patch("apps.exchange_rates.services.fetch_decoded_rates")
+    def test_as_of_detail(self, mock_fetch):
+        """단건 조회(/{pk}/)의 as_of"""
+        from django.test import Client
+
+        mock_fetch.return_value = decode_items(self.PAYLOAD)
+        save_exchange_rates(date(2024, 1, 15))
+        usd = ExchangeRate.objects.get(code="USD")
+        first_known = usd.updated_at
+        mock_fetch.return_value = decode_items([self.PAYLOAD[0] | {"deal_bas_r": "1,433.00"}])
+        save_exchange_rates(date(2024, 1, 15))
+
+        client = Client()
+        url = f"/api/exchange-rates/{usd.pk}/"
+        self.assertEqual(client.get(url).json()["base_rate"], "1433.0000")
+        response = client.get(url, {"as_of": "2030-01-01T00:00:00"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["base_rate"], "1433.0000")
+        self.assertEqual(client.get(url, {"as_of": first_known.isoformat()}).json()["base_rate"], "1432.5000")
+        self.assertEqual(client.get(url, {"as_of": (first_known - timedelta(seconds=1)).isoformat()}).status_code, 404)
+
+    @patch("apps.exchange_rates.services.fetch_decoded_rates")
+    def test_admin_changes_keep_as_of(self, mock_fetch):
+        """관리자 수정/삭제도 정정 이력을 남겨 as_of 조회가 이전 값을 돌려줌"""
+        from django.contrib.auth.models import User
+        from django.test import Client
+
+        mock_fetch.return_value = decode_items(self.PAYLOAD)
+        save_exchange_rates(date(2024, 1, 15))
+        usd = ExchangeRate.objects.get(code="USD")
+        first_known = usd.updated_at
+        client = Client()
+        client.force_login(User.objects.create_superuser("admin", "admin@example.com", "password"))
+
+        client.post(
+            f"/admin/exchange_rates/exchangerate/{usd.pk}/change/",
+            {"code": "EUR", "name": "미국 달러", "base_rate": "1500.00", "date": "2024-02-01"},
+        )
+        usd.refresh_from_db()
+        self.assertEqual((usd.code, usd.date, usd.base_rate), ("USD", date(2024, 1, 15), Decimal("1500.00")))
+        self.assertGreater(usd.updated_at, first_known)
+        updated_at = usd.updated_at
+        self.assertEqual(
+            rates_as_of(ExchangeRate.objects.filter(code="USD"), first_known)[0].base_rate, Decimal("1432.50")
+        )
+
+        # 값이 같으면 이력/반영 시간 그대로
+        client.post(f"/admin/exchange_rates/exchangerate/{usd.pk}/change/", {"name": "미국 달러", "base_rate": "1500"})
+        usd.refresh_from_db()
+        self.assertEqual(usd.updated_at, updated_at)
+        self.assertEqual(ExchangeRateRevision.objects.filter(code="USD").count(), 1)
+
+        eur = ExchangeRate.objects.get(code="EUR")
+        client.post(f"/admin/exchange_rates/exchangerate/{eur.pk}/delete/", {"post": "yes"})
+        self.assertFalse(ExchangeRate.objects.filter(code="EUR").exists())
+        revision = ExchangeRateRevision.objects.get(code="EUR")
+        self.assertEqual((revision.base_rate, revision.valid_from), (Decimal("1550.00"), eur.updated_at))
+
+        # 삭제 후 다시 수집되면 삭제 전 시점에는 삭제된 값, 그 사이에는 빈 결과
+        deleted_at = revision.superseded_at
+        mock_fetch.return_value = decode_items([self.PAYLOAD[1] | {"deal_bas_r": "1,560.00"}])
+        save_exchange_rates(date(2024, 1, 15))
+        queryset = ExchangeRate.objects.filter(code="EUR")
+        self.assertEqual(rates_as_of(queryset, first_known)[0].base_rate, Decimal("1550.00"))
+        self.assertEqual(rates_as_of(queryset, deleted_at), [])
+        self.assertEqual(rates_as_of(queryset, timezone.now())[0].base_rate, Decimal("1560.00"))
+
+
+class ExchangeRateDecoderTestCase(TestCase):
+    """응답 디코더 테스트"""
+
+    PAYLOAD = [
+        {"result": 1, "cur_unit": "USD", "cur_nm": "미국 달러", "deal_bas_r": "1,432.50", "tts": "1,446.82"},
+        {"result": 1, "cur_unit": " jpy (100)", "cur_nm": "일본 옌", "deal_bas_r": "950.12", "tts": "abc"},
+        {"result": 1, "cur_unit": "EUR", "cur_nm": "유로", "deal_bas_r": "0"},
+        {"result": 1, "cur_unit": "", "deal_bas_r": "1"},
+        {"result": 1, "cur_unit": "USD", "cur_nm": "미국 달러", "deal_bas_r": "1,433.00"},
+    ]
+
+    def body(self) -> bytes:
+        return json.dumps(self.PAYLOAD, ensure_ascii=False, indent=1).encode()
+
+    def test_normalize_code(self):
+        """통화 코드 정규화"""
+        self.assertEqual(normalize_code("USD"), "USD")
+        self.assertEqual(normalize_code(" jpy (100)"), "JPY(100)")
+
+    def test_decode_items(self):
+        """검증/변환 및 이상값 보고"""
+        decoded = decode_items(self.PAYLOAD)
+        self.assertEqual([record.code for record in decoded.records], ["JPY(100)", "USD"])
+        usd = decoded.records[1]
+        self.assertEqual(usd.base_rate, Decimal("1433.00"))
+        self.assertIsNone(decoded.records[0].remit_send_rate)
+        self.assertEqual(
+            [(anomaly.index, anomaly.reason, anomaly.dropped) for anomaly in decoded.anomalies],
+            [
+                (1, "invalid_number", False),
+                (2, "non_positive", True),
+                (3, "missing_code", True),
+                (4, "duplicate_code", False),
+            ],
+        )
+        self.assertEqual(decoded.item_count, 5)
+        self.assertEqual(decoded.fingerprint, payload_fingerprint(self.PAYLOAD))
+
+    def test_invalid_value_types(self):
+        """문자열/숫자가 아닌 JSON 값은 예외 대신 이상값으로 보고"""
+        decoded = decode_items(
+            [
+                {"cur_unit": "USD", "deal_bas_r": True},
+                {"cur_unit": "EUR", "deal_bas_r": "1,550", "tts": [","], "ttb": {"v": 1}, "bkpr": False},
+                {"cur_unit": "CNH", "deal_bas_r": 190.5, "tts": 192},
+            ]
+        )
+        self.assertEqual([record.code for record in decoded.records], ["EUR", "CNH"])
+        self.assertEqual(decoded.records[1].base_rate, Decimal("190.5"))
+        self.assertEqual(decoded.records[1].remit_send_rate, Decimal("192"))
+        self.assertEqual(
+            [(anomaly.code, anomaly.field, anomaly.reason, anomaly.dropped) for anomaly in decoded.anomalies],
+            [
+                ("USD", "deal_bas_r", "invalid_number", True),
+                ("EUR", "bkpr", "invalid_number", False),
+                ("EUR", "tts", "invalid_number", False),
+                ("EUR", "ttb", "invalid_number", False),
+            ],
+        )
+
+    def test_stream_independent_of_chunk_size(self):
+        """청크 크기와 무관한 스트림 디코딩 결과"""
+        body = self.body()
+        expected = decode_items(self.PAYLOAD)
+        for size in (1, 7, 64, len(body)):
+            chunks = [body[i : i + size] for i in range(0, len(body), size)]
+            decoded = decode_stream(chunks)
+            self.assertEqual(decoded.records, expected.records)
+            self.assertEqual(decoded.anomalies, expected.anomalies)
+            self.assertEqual(decoded.fingerprint, expected.fingerprint)
+
+    def test_stream_error_object(self):
+        """목록 대신 오류 객체가 온 경우"""
+        decoded = decode_stream([b'{"result": 3, "message": "invalid key"}'])
+        self.assertEqual(decoded.error, {"result": 3, "message": "invalid key"})
+        self.assertEqual(decoded.records, [])
+
+        with self.assertRaises(ValueError):
+            decode_stream([b'[{"cur_unit": "USD"}'])
+
+    def test_replay_exchange_rates(self):
+        """저장된 원본 응답 재처리"""
+        with self.assertLogs("apps.exchange_rates.services", level="WARNING"):
+            self.assertEqual(replay_exchange_rates([self.body()], date(2024, 1, 15)), 2)
+        self.assertEqual(ExchangeRate.objects.get(code="JPY(100)").base_rate, Decimal("950.12"))
+        self.assertEqual(
+            ExchangeRatePayload.objects.get(date=date(2024, 1, 15)).fingerprint, payload_fingerprint(self.PAYLOAD)
+        )
+
+        with self.assertRaises(KoreaEximAPIError):
+            replay_exchange_rates([b'{"result": 3}'], date(2024, 1, 16))
+
+
+class LatestExchangeRateTestCase(TestCase):
+    """통화별 최신 환율 스냅샷 테스트"""
+
+    def setUp(self):
+        from apps.exchange_rates.snapshots import latest_rates_cache
+
+        self.cache = latest_rates_cache
+        self.cache.invalidate()
+        self.addCleanup(self.cache.invalidate)
+
+    def _save(self, mock_fetch, search_date, base_rate):
+        mock_fetch.return_value = decode_items([{"cur_unit": "USD", "cur_nm": "미국 달러", "deal_bas_r": base_rate}])
+        with self.captureOnCommitCallbacks(execute=True):
+            save_exchange_rates(search_date)
+
+    @patch("apps.exchange_rates.services.fetch_decoded_rates")
+    def test_snapshot_follows_latest_date(self, mock_fetch):
+        """최신 고시일 데이터만 스냅샷에 반영"""
+        self._save(mock_fetch, date(2024, 1, 15), "1,432.50")
+        self._save(mock_fetch, date(2024, 1, 14), "1,420.00")  # 과거 날짜 재수집
+
+        latest = LatestExchangeRate.objects.get(code="USD")
+        self.assertEqual(latest.date, date(2024, 1, 15))
+        self.assertEqual(latest.base_rate, Decimal("1432.50"))
+
+        self._save(mock_fetch, date(2024, 1, 15), "1,433.00")  # 최신 날짜 정정
+        self.assertEqual(LatestExchangeRate.objects.get(code="USD").base_rate, Decimal("1433.00"))
+
+    @patch("apps.exchange_rates.services.fetch_decoded_rates")
+    def test_latest_endpoint_cache(self, mock_fetch):
+        """최신 환율 엔드포인트 캐시 및 수집 시 무효화"""
+        from django.test import Client
+
+        client = Client()
+        self._save(mock_fetch, date(2024, 1, 15), "1,432.50")
+
+        response = client.get("/api/exchange-rates/latest/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[0]["base_rate"], "1432.5000")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(client.get("/api/exchange-rates/latest/").status_code, 200)
+
+        self._save(mock_fetch, date(2024, 1, 16), "1,440.00")
+        response = client.get("/api/exchange-rates/latest/")
+        self.assertEqual(response.json()[0]["date"], "2024-01-16")
+
+    @patch("apps.exchange_rates.services.fetch_decoded_rates")
+    def test_latest_cache_filled_from_primary(self, mock_fetch):
+        """캐시를 다시 채울 때는 replica 라우팅 없이 primary에서 조회"""
+        from django.test import Client
+
+        self._save(mock_fetch, date(2024, 1, 15), "1,432.50")
+        with patch("django.db.router.db_for_read", return_value="replica_1") as mock_route:
+            response = Client().get("/api/exchange-rates/latest/")
+        self.assertEqual(response.json()[0]["base_rate"], "1432.5000")
+        self.assertFalse(any(call.args[0] is LatestExchangeRate for call in mock_route.call_args_list))
+
+    @patch("apps.exchange_rates.services.fetch_decoded_rates")
+    def test_admin_changes_refresh_snapshot(self, mock_fetch):
+        """관리자 수정/삭제가 스냅샷과 /latest/ 캐시에 반영됨"""
+        from django.contrib.auth.models import User
+        from django.test import Client
+
+        self._save(mock_fetch, date(2024, 1, 15), "1,432.50")
+        self._save(mock_fetch, date(2024, 1, 16), "1,440.00")
+        client = Client()
+        client.force_login(User.objects.create_superuser("admin", "admin@example.com", "password"))
+        self.assertEqual(client.get("/api/exchange-rates/latest/").json()[0]["base_rate"], "1440.0000")
+        newest = ExchangeRate.objects.get(code="USD", date=date(2024, 1, 16))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            client.post(
+                f"/admin/exchange_rates/exchangerate/{newest.pk}/change/",
+                {"code": "USD", "name": "미국 달러", "base_rate": "1441.00", "date": "2024-01-16"},
+            )
+        self.assertEqual(client.get("/api/exchange-rates/latest/").json()[0]["base_rate"], "1441.0000")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            client.post(f"/admin/exchange_rates/exchangerate/{newest.pk}/delete/", {"post": "yes"})
+        [latest] = client.get("/api/exchange-rates/latest/").json()
+        self.assertEqual((latest["date"], latest["base_rate"]), ("2024-01-15", "1432.5000"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            client.post(
+                "/admin/exchange_rates/exchangerate/",
+                {
+                    "action": "delete_selected",
+                    "_selected_action": list(ExchangeRate.objects.values_list("pk", flat=True)),
+                    "post": "yes",
+                },
+            )
+        self.assertEqual(client.get("/api/exchange-rates/latest/").json(), [])
+        self.assertFalse(LatestExchangeRate.objects.exists())
+
+    def test_stale_set_discarded(self):
+        """조회 중 무효화되면 이전 값을 캐시하지 않음"""
+        generation = self.cache.generation
+        self.cache.invalidate()
+        self.cache.set(["stale"], generation)
+        self.assertIsNone(self.cache.get())
+
+
+class RenderedDocumentTestCase(TestCase):
+    """사전 렌더링/압축 문서 테스트"""
+
+    @patch("apps.exchange_rates.services.fetch_decoded_rates")
+    def setUp(self, mock_fetch):
+        from django.test import Client
+
+        mock_fetch.return_value = decode_items(
+            [
+                {"cur_unit": "USD", "cur_nm": "미국 달러", "deal_bas_r": "1,432.50"},
+                {"cur_unit": "EUR", "cur_nm": "유로", "deal_bas_r": "1,550.00"},
+            ]
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            save_exchange_rates(date(2024, 1, 15))
+        self.client = Client()
+
+    def test_documents_rendered_on_commit(self):
+        """일별 문서 + 통화별 문서 렌더링"""
+        from apps.exchange_rates.models import RenderedDocument
+
+        self.assertEqual(
+            sorted(RenderedDocument.objects.values_list("key", flat=True)),
+            ["rates/2024-01-15", "rates/EUR/2024-01-15", "rates/USD/2024-01-15"],
+        )
+
+    def test_same_bytes_as_dynamic_path(self):
+        """사전 렌더링 응답과 동적 응답이 동일"""
+        from apps.exchange_rates.models import RenderedDocument
+
+        rendered = self.client.get("/api/exchange-rates/USD/dates/2024-01-15/")
+        self.assertIn("ETag", rendered)
+        RenderedDocument.objects.all().delete()
+        dynamic = self.client.get("/api/exchange-rates/USD/dates/2024-01-15/")
+        self.assertNotIn("ETag", dynamic)
+        self.assertEqual(rendered.content, dynamic.content)
+
+    def test_content_negotiation(self):
+        """Accept-Encoding에 따른 gzip/deflate/identity 응답"""
+        import gzip
+        import zlib
+
+        identity = self.client.get("/api/exchange-rates/dates/2024-01-15/")
+        self.assertEqual(identity.status_code, 200)
+        self.assertNotIn("Content-Encoding", identity)
+        self.assertEqual([item["code"] for item in identity.json()], ["EUR", "USD"])
+        self.assertIn("Accept-Encoding", identity["Vary"])
+
+        gzipped = self.client.get("/api/exchange-rates/dates/2024-01-15/", headers={"accept-encoding": "gzip, deflate"})
+        self.assertEqual(gzipped["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(gzipped.content), identity.content)
+
+        deflated = self.client.get(
+            "/api/exchange-rates/dates/2024-01-15/", headers={"accept-encoding": "gzip;q=0.5, deflate"}
+        )
+        self.assertEqual(deflated["Content-Encoding"], "deflate")
+        self.assertEqual(zlib.decompress(deflated.content), identity.content)
+
+    def test_conditional_request(self):
+        """If-None-Match 일치 시 304"""
+        response = self.client.get("/api/exchange-rates/dates/2024-01-15/")
+        response = self.client.get("/api/exchange-rates/dates/2024-01-15/", headers={"if-none-match": response["ETag"]})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_missing_date(self):
+        """데이터가 없는 날짜는 404"""
+        response = self.client.get("/api/exchange-rates/dates/2024-01-01/")
+        self.assertEqual(response.status_code, 404)
+
+    @patch("apps.exchange_rates.documents.render_daily_documents", side_effect=RuntimeError)
+    @patch("apps.exchange_rates.services.fetch_decoded_rates")
+    def test_revision_invalidates_documents(self, mock_fetch, mock_render):
+        """정정 수집 시 문서를 먼저 삭제해 렌더링이 실패해도 이전 문서를 응답하지 않음"""
+        from apps.exchange_rates.models import RenderedDocument
+
+        mock_fetch.return_value = decode_items([{"cur_unit": "USD", "cur_nm": "미국 달러", "deal_bas_r": "1,433.00"}])
+        with self.assertLogs("django.test", level="ERROR"), self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(save_exchange_rates(date(2024, 1, 15)), 1)
+
+        self.assertTrue(mock_render.called)
+        self.assertFalse(RenderedDocument.objects.filter(date=date(2024, 1, 15)).exists())
+        response = self.client.get("/api/exchange-rates/USD/dates/2024-01-15/")
+        self.assertNotIn("ETag", response)
+        self.assertEqual(response.json()["base_rate"], "1433.0000")
+
+    def test_admin_changes_invalidate_documents(self):
+        """관리자 수정/삭제 시 문서 무효화 후 다시 렌더링"""
+        from django.contrib.auth.models import User
+
+        from apps.exchange_rates.models import RenderedDocument
+
+        self.client.force_login(User.objects.create_superuser("admin", "admin@example.com", "password"))
+        usd = ExchangeRate.objects.get(code="USD")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                f"/admin/exchange_rates/exchangerate/{usd.pk}/change/",
+                {"code": "USD", "name": "미국 달러", "base_rate": "1440.00", "date": "2024-01-15"},
+            )
+        self.assertEqual(response.status_code, 302)
+        response = self.client.get("/api/exchange-rates/USD/dates/2024-01-15/")
+        self.assertIn("ETag", response)
+        self.assertEqual(response.json()["base_rate"], "1440.0000")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                "/admin/exchange_rates/exchangerate/",
+                {"action": "delete_selected", "_selected_action": [usd.pk], "post": "yes"},
+            )
+        self.assertEqual(
+            sorted(RenderedDocument.objects.values_list("key", flat=True)), ["rates/2024-01-15", "rates/EUR/2024-01-15"]
+        )
+        self.assertEqual(self.client.get("/api/exchange-rates/USD/dates/2024-01-15/").status_code, 404)
+
+    def test_negotiate_encoding(self):
+        """Accept-Encoding 파싱"""
+        from apps.exchange_rates.documents import negotiate_encoding
+
+        self.assertEqual(negotiate_encoding(""), "identity")
+        self.assertEqual(negotiate_encoding("br"), "identity")
+        self.assertEqual(negotiate_encoding("deflate, gzip"), "gzip")
+        self.assertEqual(negotiate_encoding("gzip;q=0, *"), "deflate")
+        self.assertEqual(negotiate_encoding("*;q=0"), "identity")
+
+
+class LargeTableAdminTestCase(TestCase):
+    """대용량 환율 이력 관리자 목록 테스트"""
+
+    URL = "/admin/exchange_rates/exchangerate/"
+
+    def setUp(self):
+        from django.contrib.auth.models import User
+
+        self.client.force_login(User.objects.create_superuser("admin", "admin@example.com", "password"))
+        names = {"USD": "미국 달러", "EUR": "유로", "JPY(100)": "일본 옌"}
+        ExchangeRate.objects.bulk_create(
+            ExchangeRate(code=code, name=name, base_rate=Decimal("1000"), date=date(2024, 1, 1) + timedelta(days=i))
+            for i in range(5)
+            for code, name in names.items()
+        )
+        update_latest_rates(list(ExchangeRate.objects.filter(date=date(2024, 1, 5))))
+
+    @patch("apps.exchange_rates.admin.ExchangeRateAdmin.list_per_page", 4)
+    def test_keyset_paging(self):
+        """커서로 끝까지 이동하면 전체 목록과 같은 순서"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from apps.exchange_rates.changelist import estimated_row_count
+
+        seen = []
+        params = {}
+        with CaptureQueriesContext(connection) as queries:
+            while True:
+                cl = self.client.get(self.URL, params).context["cl"]
+                seen.extend((rate.date, rate.code) for rate in cl.result_list)
+                if not cl.next_cursor:
+                    break
+                params = {"after": cl.next_cursor}
+
+        self.assertEqual(seen, list(ExchangeRate.objects.order_by("-date", "code").values_list("date", "code")))
+        sql = " ".join(query["sql"] for query in queries.captured_queries if "exchangerate" in query["sql"])
+        self.assertNotIn("COUNT(", sql)
+        self.assertNotIn("OFFSET", sql)
+        self.assertEqual(cl.result_count, estimated_row_count(ExchangeRate, "default"))
+
+    def test_currency_filter_and_search(self):
+        """통화 필터 항목은 스냅샷에서, 검색은 코드 접두어/통화명"""
+        cl = self.client.get(self.URL).context["cl"]
+        currency_filter = cl.filter_specs[0]
+        self.assertEqual([code for code, _ in currency_filter.lookup_choices], ["EUR", "JPY(100)", "USD"])
+
+        cl = self.client.get(self.URL, {"code": "USD"}).context["cl"]
+        self.assertEqual({rate.code for rate in cl.result_list}, {"USD"})
+        self.assertEqual(cl.result_count, 5)
+
+        cl = self.client.get(self.URL, {"q": "jp"}).context["cl"]
+        self.assertEqual({rate.code for rate in cl.result_list}, {"JPY(100)"})
+        cl = self.client.get(self.URL, {"q": "유로"}).context["cl"]
+        self.assertEqual({rate.code for rate in cl.result_list}, {"EUR"})
+
+        LatestExchangeRate.objects.all().delete()  # 스냅샷에 없는 코드는 이력 테이블 접두어 검색
+        cl = self.client.get(self.URL, {"q": "us"}).context["cl"]
+        self.assertEqual({rate.code for rate in cl.result_list}, {"USD"})
+
+    def test_invalid_cursor(self):
+        """잘못된 커서는 오류 표시와 함께 첫 화면으로"""
+        response = self.client.get(self.URL, {"after": "invalid"})
+        self.assertRedirects(response, f"{self.URL}?e=1")
+
+
+class PartitionedStorageTestCase(TestCase):
+    """PostgreSQL 연도별 파티션 저장소 테스트 (파티션 구성 테스트는 PostgreSQL에서만 실행)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        from io import StringIO
+
+        from django.core.management import call_command
+        from django.db import connection
+
+        # 클래스 트랜잭션 안에서 전환하므로 테스트가 끝나면 단일 테이블로 롤백됨
+        if connection.vendor == "postgresql":
+            call_command("partition_exchange_rates", stdout=StringIO())
+
+    @classmethod
+    def tearDownClass(cls):
+        from django.db import connection
+
+        from apps.exchange_rates import partitioning
+
+        super().tearDownClass()
+        partitioning._forget(connection)
+
+    def setUp(self):
+        from django.db import connection
+
+        from apps.exchange_rates import partitioning
+
+        self.connection = connection
+        self.partitioning = partitioning
+        partitioning._forget(connection)
+
+    def require_partitioned(self):
+        if not self.partitioning.is_partitioned(self.connection):
+            self.skipTest("파티션 저장소가 아님")
+
+    def test_sqlite_fallback(self):
+        """파티션이 아닌 DB에서는 아무것도 하지 않고, 전환 명령은 PostgreSQL 전용"""
+        from django.core.management import CommandError, call_command
+
+        connection = MagicMock(vendor="sqlite", alias="sqlite")
+        self.assertFalse(self.partitioning.is_partitioned(connection))
+        if self.connection.vendor != "postgresql":
+            with self.assertRaises(CommandError):
+                call_command("partition_exchange_rates")
+
+    def test_migrate_blocked_when_partitioned(self):
+        """파티션 상태에서는 exchange_rates migration 적용을 막음"""
+        from django.core.management import CommandError
+
+        self.require_partitioned()
+        other = [(MagicMock(app_label="auth"), False)]
+        self.partitioning.check_pending_migrations(sender=None, using="default", plan=other)
+        with self.assertRaises(CommandError):
+            self.partitioning.check_pending_migrations(
+                sender=None, using="default", plan=[(MagicMock(app_label="exchange_rates"), False)]
+            )
+
+    def test_revert(self):
+        """--revert로 migration 상태와 같은 단일 테이블 구성으로 되돌림 (데이터 유지)"""
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        self.require_partitioned()
+        ExchangeRate.objects.create(code="USD", name="미국 달러", base_rate=Decimal("1200"), date=date(2024, 3, 1))
+        call_command("partition_exchange_rates", revert=True, stdout=StringIO())
+
+        self.assertFalse(self.partitioning.is_partitioned(self.connection))
+        self.assertEqual(ExchangeRate.objects.get().code, "USD")
+        with self.connection.cursor() as cursor:
+            constraints = self.connection.introspection.get_constraints(cursor, self.partitioning.TABLE)
+        expected = {index.name for index in ExchangeRate._meta.indexes}
+        self.assertTrue(expected <= set(constraints))
+
+    def test_partitions_prepared_only_on_write(self):
+        """원본이 바뀌지 않은 재수집에서는 파티션을 확인하지 않음"""
+        payload = [{"cur_unit": "USD", "cur_nm": "미국 달러", "deal_bas_r": "1,432.50"}]
+        with patch("apps.exchange_rates.services.ensure_partitions") as mock_ensure:
+            store_exchange_rates(payload, date(2024, 1, 15))
+            store_exchange_rates(payload, date(2024, 1, 15))
+        mock_ensure.assert_called_once_with([date(2024, 1, 15)])
+
+    def test_layout(self):
+        """BRIN 인덱스와 중복 인덱스 정리"""
+        self.require_partitioned()
+        with self.connection.cursor() as cursor:
+            cursor.execute("SELECT indexdef FROM pg_indexes WHERE tablename = %s", [self.partitioning.TABLE])
+            indexes = [row[0] for row in cursor.fetchall()]
+        self.assertEqual(len(indexes), 4)
+        self.assertTrue(any("USING brin (date)" in index for index in indexes))
+        self.assertFalse(any("btree (date)" in index for index in indexes))
+
+    def test_partition_created_on_store(self):
+        """수집 시 연도 파티션 생성, DEFAULT 파티션에 있던 행은 옮겨짐"""
+        self.require_partitioned()
+        ExchangeRate.objects.create(code="USD", name="미국 달러", base_rate=Decimal("1200"), date=date(1990, 3, 1))
+        self.assertNotIn(1990, self.partitioning.existing_partition_years(self.connection))
+
+        store_exchange_rates([{"cur_unit": "EUR", "cur_nm": "유로", "deal_bas_r": "1,300"}], date(1990, 3, 2))
+        self.assertIn(1990, self.partitioning.existing_partition_years(self.connection))
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {self.partitioning.partition_name(1990)}")
+            self.assertEqual(cursor.fetchone()[0], 2)
+            cursor.execute(f"SELECT COUNT(*) FROM {self.partitioning.DEFAULT_PARTITION}")
+            self.assertEqual(cursor.fetchone()[0], 0)
+        self.assertEqual(ExchangeRate.objects.filter(date__year=1990).count(), 2)
+
+
+class PrimaryReplicaRouterTestCase(SimpleTestCase):
+    """Primary/replica DB 라우터 테스트"""
+
+    def setUp(self):
+        from config import db_router
+
+        self.db_router = db_router
+        self.router = db_router.PrimaryReplicaRouter()
+        db_router._health.clear()
+        token = db_router._pinned.set(False)
+        self.addCleanup(db_router._pinned.reset, token)
+
+    @override_settings(DATABASE_REPLICAS=["replica_1", "replica_2"])
+    def test_read_from_healthy_replica(self):
+        """정상 replica로 읽기 분산"""
+        with patch("config.db_router._check_replica", side_effect=lambda alias: alias == "replica_2"):
+            self.assertEqual(self.router.db_for_read(ExchangeRate), "replica_2")
+
+    @override_settings(DATABASE_REPLICAS=["replica_1"])
+    def test_failover_to_primary(self):
+        """모든 replica 장애 시 primary로 failover"""
+        with patch("config.db_router._check_replica", return_value=False) as mock_check:
+            self.assertEqual(self.router.db_for_read(ExchangeRate), "default")
+            self.router.db_for_read(ExchangeRate)
+        mock_check.assert_called_once()  # 헬스 체크 결과 캐시
+
+    @override_settings(DATABASE_REPLICAS=["replica_1"])
+    def test_read_your_writes(self):
+        """쓰기 이후 읽기는 primary로 고정"""
+        with patch("config.db_router._check_replica", return_value=True):
+            self.assertEqual(self.router.db_for_read(ExchangeRate), "replica_1")
+            self.assertEqual(self.router.db_for_write(ExchangeRate), "default")
+            self.assertEqual(self.router.db_for_read(ExchangeRate), "default")
+
+    @override_settings(REPLICA_PIN_SECONDS=10)
+    def test_pinning_middleware(self):
+        """쓰기 요청 후 쿠키로 다음 요청의 읽기를 primary로 고정"""
+        from django.http import HttpResponse
+        from django.test import RequestFactory
+
+        def write_view(request):
+            self.router.db_for_write(ExchangeRate)
+            return HttpResponse()
+
+        def read_view(request):
+            self.assertTrue(self.db_router.is_pinned())
+            return HttpResponse()
+
+        factory = RequestFactory()
+        response = self.db_router.ReplicaPinningMiddleware(write_view)(factory.post("/api/exchange-rates/fetch/"))
+        self.assertEqual(response.cookies[self.db_router.PIN_COOKIE_NAME]["max-age"], 10)
+        self.assertFalse(self.db_router.is_pinned())
+
+        request = factory.get("/api/exchange-rates/")
+        request.COOKIES[self.db_router.PIN_COOKIE_NAME] = "1"
+        response = self.db_router.ReplicaPinningMiddleware(read_view)(request)
+        self.assertNotIn(self.db_router.PIN_COOKIE_NAME, response.cookies)
+
+
+class IngestEntrypointTestCase(TestCase):
+    """수집 전용 엔트리포인트(ingest.py) 테스트"""
+
+    @patch("apps.exchange_rates.services.save_exchange_rates")
+    def test_ingest_by_date(self, mock_save):
+        """특정 날짜 수집"""
+        import ingest
+
+        mock_save.return_value = 3
+        with patch("sys.argv", ["ingest.py", "--date", "2024-01-15"]):
+            self.assertEqual(ingest.main(), 0)
+        mock_save.assert_called_once_with(date(2024, 1, 15))
+
+    @patch("apps.exchange_rates.services.save_exchange_rates")
+    def test_ingest_api_error(self, mock_save):
+        """API 오류 시 0이 아닌 종료 코드"""
+        import ingest
+
+        mock_save.side_effect = KoreaEximAPIError("API 호출 실패")
+        with patch("sys.argv", ["ingest.py"]):
+            self.assertEqual(ingest.main(), 1)
+
+
 class ExchangeRateAPITestCase(TestCase):
     """환율 API 테스트"""
 
@@ -288,7 +1130,7 @@ class ExchangeRateAPITestCase(TestCase):
         response = client.get("/api/exchange-rates/USD/dates/2024-01-01/")
         self.assertEqual(response.status_code, 404)
 
-    @patch("apps.exchange_rates.views.save_exchange_rates")
+    @patch("apps.exchange_rates.views.asave_exchange_rates")
     def test_fetch_today(self, mock_save):
         """오늘 환율 수집 테스트"""
         from django.test import Client
@@ -300,7 +1142,7 @@ class ExchangeRateAPITestCase(TestCase):
         data = response.json()
         self.assertEqual(data["count"], 10)
 
-    @patch("apps.exchange_rates.views.save_exchange_rates")
+    @patch("apps.exchange_rates.views.asave_exchange_rates")
     def test_fetch_by_date(self, mock_save):
         """특정 날짜 환율 수집 테스트"""
         from django.test import Client
@@ -313,3 +1155,31 @@ class ExchangeRateAPITestCase(TestCase):
         self.assertEqual(data["date"], "2024-01-10")
         self.assertEqual(data["count"], 5)
 
+
+class AsyncExchangeRateAPITestCase(TestCase):
+    """ASGI (AsyncClient) 환경 환율 API 테스트"""
+
+    def setUp(self):
+        ExchangeRate.objects.create(code="USD", name="미국 달러", base_rate=Decimal("1432.50"), date=date(2024, 1, 15))
+        ExchangeRate.objects.create(code="USD", name="미국 달러", base_rate=Decimal("1420.00"), date=date(2024, 1, 14))
+
+    async def test_list_exchange_rates(self):
+        """비동기 목록 조회 테스트"""
+        response = await self.async_client.get("/api/exchange-rates/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["results"]), 2)
+
+    async def test_by_code(self):
+        """비동기 통화 코드별 조회 테스트"""
+        response = await self.async_client.get("/api/exchange-rates/USD/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["results"]), 2)
+
+    async def test_by_code_and_date(self):
+        """비동기 통화 코드 + 날짜 조회 테스트"""
+        response = await self.async_client.get("/api/exchange-rates/USD/dates/2024-01-15/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["base_rate"], "1432.5000")
+
+        response = await self.async_client.get("/api/exchange-rates/USD/dates/2024-01-01/")
+        self.assertEqual(response.status_code, 404)
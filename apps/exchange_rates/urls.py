@@ -2,8 +2,8 @@
 환율 API URL 설정
 """
 
+from adrf.routers import DefaultRouter
 from django.urls import include, path
-from rest_framework.routers import DefaultRouter
 
 from .views import ExchangeRateViewSet
 
@@ -4,13 +4,22 @@
 
 from datetime import date, datetime
 
-from rest_framework import status, viewsets
+from adrf import viewsets
+from adrf.mixins import get_data
+from asgiref.sync import sync_to_async
+from django.db import DEFAULT_DB_ALIAS
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
-from .models import ExchangeRate
-from .serializers import ExchangeRateSerializer
-from .services import KoreaEximAPIError, save_exchange_rates
+from .documents import aserve_document, currency_document_key, day_document_key
+from .models import ExchangeRate, LatestExchangeRate
+from .serializers import ExchangeRateSerializer, LatestExchangeRateSerializer
+from .services import KoreaEximAPIError, asave_exchange_rates, known_as_of, rates_as_of
+from .snapshots import latest_rates_cache
 
 
 class ExchangeRateViewSet(viewsets.ReadOnlyModelViewSet):
@@ -19,10 +28,17 @@ class ExchangeRateViewSet(viewsets.ReadOnlyModelViewSet):
 
     제공하는 엔드포인트:
     - GET /api/exchange-rates/ : 환율 목록 조회 (필터링/페이지네이션)
+    - GET /api/exchange-rates/latest/ : 통화별 최신 환율 (스냅샷)
     - GET /api/exchange-rates/{code}/ : 특정 통화 전체 이력
+    - GET /api/exchange-rates/dates/{date}/ : 특정 날짜 전체 통화
     - GET /api/exchange-rates/{code}/dates/{date}/ : 특정 통화 + 날짜
     - POST /api/exchange-rates/fetch/ : 오늘 환율 수집
     - POST /api/exchange-rates/fetch/dates/{date}/ : 특정 날짜 환율 수집
+
+    조회 엔드포인트는 ?as_of=<ISO 8601 일시> 로 해당 시점에 알려져 있던 값을 조회할 수 있습니다.
+    날짜 단위 조회는 수집 시 미리 렌더링/압축해 둔 문서를 그대로 응답합니다 (documents.py).
+
+    모든 핸들러는 비동기로 동작합니다 (ASGI에서 워커를 점유하지 않음).
     """
 
     queryset = ExchangeRate.objects.all()
@@ -52,35 +68,124 @@ class ExchangeRateViewSet(viewsets.ReadOnlyModelViewSet):
 
         return queryset
 
+    def get_as_of(self):
+        """as_of 파라미터 (해당 시점 기준 조회) 파싱"""
+        as_of = self.request.query_params.get("as_of")
+        if not as_of:
+            return None
+        try:
+            known_at = parse_datetime(as_of)
+        except ValueError:
+            known_at = None
+        if known_at is None:
+            raise ValidationError({"as_of": "일시 형식이 올바르지 않습니다. ISO 8601 형식으로 입력하세요."})
+        if timezone.is_naive(known_at):
+            known_at = timezone.make_aware(known_at)
+        return known_at
+
+    async def afilter_queryset(self, queryset):
+        """as_of가 주어지면 해당 시점에 이미 수집되어 있던 행만 남김 (값 변환은 페이지 단위로)"""
+        queryset = await super().afilter_queryset(queryset)
+        known_at = self.get_as_of()
+        if known_at is not None:
+            return known_as_of(queryset, known_at)
+        return queryset
+
+    async def apaginate_queryset(self, queryset):
+        """as_of가 주어지면 조회한 페이지의 행만 해당 시점 값으로 변환"""
+        page = await super().apaginate_queryset(queryset)
+        known_at = self.get_as_of()
+        if page is not None and known_at is not None:
+            return await sync_to_async(rates_as_of)(page, known_at)
+        return page
+
+    async def aretrieve(self, request, *args, **kwargs):
+        """단건 조회 (as_of가 주어지면 해당 시점 값)"""
+        instance = await self.aget_object()
+        known_at = self.get_as_of()
+        if known_at is not None:
+            instance = (await sync_to_async(rates_as_of)([instance], known_at))[0]
+        serializer = self.get_serializer(instance)
+        return Response(await get_data(serializer))
+
+    @action(detail=False, methods=["get"], url_path="latest")
+    async def latest(self, request):
+        """통화별 최신 환율 조회 (이력 테이블 대신 스냅샷 테이블 + 프로세스 로컬 캐시)"""
+        data = latest_rates_cache.get()
+        if data is None:
+            generation = latest_rates_cache.generation
+            # 캐시는 TTL 동안 모든 요청에 쓰이므로 복제 지연이 있을 수 있는 replica 대신 primary에서 채움
+            rates = [rate async for rate in LatestExchangeRate.objects.using(DEFAULT_DB_ALIAS)]
+            data = list(await get_data(LatestExchangeRateSerializer(rates, many=True)))
+            latest_rates_cache.set(data, generation)
+        return Response(data)
+
+    @action(detail=False, methods=["get"], url_path=r"dates/(?P<rate_date>\d{4}-\d{2}-\d{2})")
+    async def by_date(self, request, rate_date=None):
+        """특정 날짜의 전체 통화 환율 조회"""
+        known_at = self.get_as_of()
+        if known_at is None:
+            response = await aserve_document(request._request, day_document_key(rate_date))
+            if response is not None:
+                return response
+
+        queryset = ExchangeRate.objects.filter(date=rate_date).order_by("code")
+        if known_at is None:
+            rates = [rate async for rate in queryset]
+        else:
+            rates = await sync_to_async(rates_as_of)(queryset, known_at)
+
+        if not rates:
+            return Response(
+                {"error": f"{rate_date} 환율 데이터가 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        serializer = self.get_serializer(rates, many=True)
+        return Response(await get_data(serializer))
+
     @action(detail=False, methods=["get"], url_path=r"(?P<code>[A-Z]+)")
-    def by_code(self, request, code=None):
+    async def by_code(self, request, code=None):
         """특정 통화 코드의 전체 환율 이력 조회"""
-        queryset = self.get_queryset().filter(code=code.upper())
-        page = self.paginate_queryset(queryset)
+        queryset = await self.afilter_queryset(self.get_queryset().filter(code=code.upper()))
+        page = await self.apaginate_queryset(queryset)
         if page is not None:
             serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+            return await self.get_apaginated_response(await get_data(serializer))
+        rates = [rate async for rate in queryset]
+        known_at = self.get_as_of()
+        if known_at is not None:
+            rates = await sync_to_async(rates_as_of)(rates, known_at)
+        serializer = self.get_serializer(rates, many=True)
+        return Response(await get_data(serializer))
 
     @action(detail=False, methods=["get"], url_path=r"(?P<code>[A-Z]+)/dates/(?P<rate_date>\d{4}-\d{2}-\d{2})")
-    def by_code_and_date(self, request, code=None, rate_date=None):
+    async def by_code_and_date(self, request, code=None, rate_date=None):
         """특정 통화 코드 + 날짜의 환율 조회"""
-        try:
-            exchange_rate = ExchangeRate.objects.get(code=code.upper(), date=rate_date)
-            serializer = self.get_serializer(exchange_rate)
-            return Response(serializer.data)
-        except ExchangeRate.DoesNotExist:
+        known_at = self.get_as_of()
+        if known_at is None:
+            response = await aserve_document(request._request, currency_document_key(code.upper(), rate_date))
+            if response is not None:
+                return response
+
+        queryset = ExchangeRate.objects.filter(code=code.upper(), date=rate_date)
+        if known_at is None:
+            exchange_rate = await queryset.afirst()
+        else:
+            exchange_rate = next(iter(await sync_to_async(rates_as_of)(queryset, known_at)), None)
+
+        if exchange_rate is None:
             return Response(
                 {"error": f"{code} 통화의 {rate_date} 환율 데이터가 없습니다."},
                 status=status.HTTP_404_NOT_FOUND,
             )
+        serializer = self.get_serializer(exchange_rate)
+        return Response(await get_data(serializer))
 
     @action(detail=False, methods=["post"], url_path="fetch")
-    def fetch_today(self, request):
+    async def fetch_today(self, request):
         """오늘 날짜 환율 데이터 수집"""
         try:
-            count = save_exchange_rates()
+            count = await asave_exchange_rates()
             return Response(
                 {
                     "message": f"오늘({date.today()}) 환율 데이터 {count}건 수집 완료",
@@ -95,11 +200,11 @@ class ExchangeRateViewSet(viewsets.ReadOnlyModelViewSet):
             )
 
     @action(detail=False, methods=["post"], url_path=r"fetch/dates/(?P<fetch_date>\d{4}-\d{2}-\d{2})")
-    def fetch_by_date(self, request, fetch_date=None):
+    async def fetch_by_date(self, request, fetch_date=None):
         """특정 날짜 환율 데이터 수집"""
         try:
             target_date = datetime.strptime(fetch_date, "%Y-%m-%d").date()
-            count = save_exchange_rates(target_date)
+            count = await asave_exchange_rates(target_date)
             return Response(
                 {
                     "message": f"{fetch_date} 환율 데이터 {count}건 수집 완료",
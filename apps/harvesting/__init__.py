@@ -0,0 +1,7 @@
+"""
+멀티 프로바이더 수집 파이프라인
+
+환율/주가/채권 등 데이터 소스별 Provider(fetch → parse → normalize → write)를
+settings.HARVEST_PROVIDERS에 등록하면, pipeline.harvest()가 모든 프로바이더와
+심볼을 동시에 수집하고 프로바이더별로 묶어서(batch) 저장합니다.
+"""
@@ -0,0 +1,146 @@
+"""
+멀티 프로바이더 동시 수집 파이프라인
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any
+
+import httpx
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from .providers import Provider
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HarvestResult:
+    """프로바이더 하나의 수집 결과"""
+
+    provider: str
+    fetched: int = 0
+    written: int = 0
+    errors: list[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+class RateLimiter:
+    """요청 간 최소 간격을 보장하는 비동기 rate limiter"""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            if self._next_at > now:
+                await asyncio.sleep(self._next_at - now)
+                now = self._next_at
+            self._next_at = now + self.interval
+
+
+def load_providers() -> list[Provider]:
+    """settings.HARVEST_PROVIDERS에 등록된 프로바이더 인스턴스 생성"""
+    return [import_string(path)() for path in settings.HARVEST_PROVIDERS]
+
+
+async def _harvest_provider(provider: Provider, client: httpx.AsyncClient, target_date: date) -> HarvestResult:
+    result = HarvestResult(provider=provider.name or type(provider).__name__)
+    started = time.monotonic()
+    limiter = RateLimiter(provider.rate_limit)
+    semaphore = asyncio.Semaphore(provider.max_concurrency)
+    buffer: list = []
+    write = sync_to_async(provider.write)
+    write_payload = sync_to_async(provider.write_payload)
+
+    async def store(records: list, raw: Any = None) -> None:
+        try:
+            if provider.whole_payload:
+                written = await write_payload(raw, records, target_date)
+            else:
+                written = await write(records, target_date)
+        except Exception as e:
+            logger.exception(f"[{result.provider}] {len(records)}건 저장 실패")
+            result.errors.append(f"write: {e}")
+        else:
+            # 동시에 저장하는 다른 심볼과 갱신이 겹치지 않도록 await가 끝난 뒤 더함
+            result.written += written
+
+    async def flush() -> None:
+        batch = buffer[:]
+        buffer.clear()
+        await store(batch)
+
+    async def harvest_symbol(symbol: str | None) -> None:
+        try:
+            async with semaphore:
+                await limiter.acquire()
+                raw = await provider.fetch(client, symbol, target_date)
+            records = [
+                record
+                for item in provider.parse(raw, symbol, target_date)
+                if (record := provider.normalize(item, symbol, target_date)) is not None
+            ]
+        except Exception as e:
+            logger.warning(f"[{result.provider}] {symbol or '-'} 수집 실패: {e}")
+            result.errors.append(f"{symbol or '-'}: {e}")
+            return
+
+        result.fetched += len(records)
+        if provider.whole_payload:
+            await store(records, raw)
+            return
+        buffer.extend(records)
+        if len(buffer) >= provider.batch_size:
+            await flush()
+
+    try:
+        symbols = list(provider.symbols(target_date))
+        await asyncio.gather(*(harvest_symbol(symbol) for symbol in symbols))
+        if buffer:
+            await flush()
+    except Exception as e:
+        logger.exception(f"[{result.provider}] 수집 실패")
+        result.errors.append(str(e))
+
+    result.elapsed = time.monotonic() - started
+    logger.info(
+        f"[{result.provider}] {target_date} 수집 {result.fetched}건, 저장 {result.written}건, "
+        f"오류 {len(result.errors)}건 ({result.elapsed:.2f}s)"
+    )
+    return result
+
+
+async def harvest(target_date: date | None = None, providers: list[Provider] | None = None) -> list[HarvestResult]:
+    """
+    모든 프로바이더를 동시에 수집합니다.
+
+    프로바이더별 rate limit/동시성 제한을 지키고, 한 프로바이더(또는 심볼)의
+    실패는 결과에 기록만 하고 다른 프로바이더 수집에 영향을 주지 않습니다.
+    """
+    if target_date is None:
+        target_date = date.today()
+    if providers is None:
+        providers = load_providers()
+
+    async with httpx.AsyncClient(timeout=settings.HARVEST_REQUEST_TIMEOUT) as client:
+        return list(await asyncio.gather(*(_harvest_provider(p, client, target_date) for p in providers)))
+
+
+def run_harvest(target_date: date | None = None, providers: list[Provider] | None = None) -> list[HarvestResult]:
+    """harvest의 동기 진입점 (cron/ingest.py용)"""
+    return async_to_sync(harvest)(target_date, providers)
@@ -0,0 +1,61 @@
+"""
+수집 프로바이더 인터페이스
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from datetime import date
+from typing import Any
+
+import httpx
+
+
+class Provider(ABC):
+    """
+    데이터 소스 하나에 대한 수집 프로바이더
+
+    한 심볼(symbol)에 대해 fetch → parse → normalize 순서로 레코드를 만들고,
+    파이프라인이 모은 레코드를 batch_size 단위로 write에 넘깁니다
+    (whole_payload이면 심볼 응답 단위로 write_payload에 넘김).
+    fetch는 이벤트 루프에서, write는 DB 스레드에서 실행됩니다.
+    """
+
+    # 프로바이더 이름 (로그/결과 구분용)
+    name: str = ""
+
+    # 초당 최대 요청 수 (0이면 제한 없음)
+    rate_limit: float = 0
+
+    # 동시에 진행할 최대 요청 수
+    max_concurrency: int = 4
+
+    # write 한 번에 넘길 최대 레코드 수
+    batch_size: int = 500
+
+    # True이면 심볼 응답 하나의 레코드를 batch로 나누거나 다른 심볼과 합치지 않고 write_payload로 한 번에 저장
+    # (응답 전체의 지문처럼 원본 단위로 처리해야 하는 소스용, batch_size는 사용하지 않음)
+    whole_payload: bool = False
+
+    def symbols(self, target_date: date) -> Iterable[str | None]:
+        """수집할 심볼 목록 (기본값: 한 번의 호출로 전체를 받는 소스)"""
+        return [None]
+
+    @abstractmethod
+    async def fetch(self, client: httpx.AsyncClient, symbol: str | None, target_date: date) -> Any:
+        """원본 응답 조회"""
+
+    def parse(self, raw: Any, symbol: str | None, target_date: date) -> Iterable[Any]:
+        """원본 응답을 항목 단위로 분리 (기본값: 원본이 항목 리스트)"""
+        return raw
+
+    def normalize(self, item: Any, symbol: str | None, target_date: date) -> Any | None:
+        """항목을 저장용 레코드로 변환 (None이면 버림)"""
+        return item
+
+    @abstractmethod
+    def write(self, records: list[Any], target_date: date) -> int:
+        """레코드 묶음 저장 후 저장된 개수 반환"""
+
+    def write_payload(self, raw: Any, records: list[Any], target_date: date) -> int:
+        """whole_payload 모드에서 심볼 응답 하나(원본과 전체 레코드) 저장 (기본값: write)"""
+        return self.write(records, target_date)
@@ -0,0 +1,144 @@
+"""
+수집 파이프라인 테스트
+"""
+
+import asyncio
+import time
+from datetime import date
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase
+
+from apps.exchange_rates.decoder import decode_items
+from apps.exchange_rates.models import ExchangeRate, ExchangeRatePayload
+from apps.exchange_rates.providers import KoreaEximProvider
+from apps.exchange_rates.services import payload_fingerprint
+from apps.harvesting.pipeline import RateLimiter, run_harvest
+from apps.harvesting.providers import Provider
+
+
+class FakeProvider(Provider):
+    """심볼별로 항목 2개를 돌려주는 테스트용 프로바이더"""
+
+    name = "fake"
+    batch_size = 3
+
+    def __init__(self, symbols=("A", "B", "C"), failing=()):
+        self._symbols = symbols
+        self.failing = failing
+        self.batches = []
+
+    def symbols(self, target_date):
+        return self._symbols
+
+    async def fetch(self, client, symbol, target_date):
+        if symbol in self.failing:
+            raise ValueError(f"{symbol} 조회 실패")
+        return [{"symbol": symbol, "value": 1}, {"symbol": symbol, "value": None}]
+
+    def normalize(self, item, symbol, target_date):
+        return item if item["value"] is not None else None
+
+    def write(self, records, target_date):
+        self.batches.append(records)
+        return len(records)
+
+
+class WholePayloadProvider(FakeProvider):
+    """심볼 응답을 나누지 않고 저장하는 테스트용 프로바이더"""
+
+    name = "whole"
+    whole_payload = True
+
+    async def fetch(self, client, symbol, target_date):
+        return [{"symbol": symbol, "value": i} for i in range(self.batch_size + 2)]
+
+    def write_payload(self, raw, records, target_date):
+        self.batches.append((len(raw), records))
+        return len(records)
+
+
+class BrokenProvider(FakeProvider):
+    name = "broken"
+
+    def symbols(self, target_date):
+        raise RuntimeError("심볼 목록 조회 실패")
+
+
+class PipelineTestCase(SimpleTestCase):
+    """파이프라인 동시 수집/배치 저장/장애 격리 테스트"""
+
+    def test_batches_records(self):
+        """정규화된 레코드를 batch_size 단위로 저장"""
+        provider = FakeProvider(symbols=("A", "B", "C", "D"))
+        [result] = run_harvest(date(2024, 1, 15), [provider])
+
+        self.assertTrue(result.ok)
+        self.assertEqual(result.fetched, 4)  # value=None 항목은 normalize에서 제외
+        self.assertEqual(result.written, 4)
+        self.assertEqual([len(batch) for batch in provider.batches], [3, 1])
+
+    def test_whole_payload(self):
+        """whole_payload 모드는 심볼 응답 하나를 batch_size와 무관하게 한 번에 저장"""
+        provider = WholePayloadProvider(symbols=("A", "B"))
+        [result] = run_harvest(date(2024, 1, 15), [provider])
+
+        self.assertTrue(result.ok)
+        self.assertEqual(result.written, 10)
+        self.assertEqual(
+            sorted((raw_count, records[0]["symbol"], len(records)) for raw_count, records in provider.batches),
+            [(5, "A", 5), (5, "B", 5)],
+        )
+
+    def test_isolates_failures(self):
+        """심볼/프로바이더 실패가 다른 수집에 영향을 주지 않음"""
+        partial = FakeProvider(failing=("B",))
+        healthy = FakeProvider()
+        healthy.name = "healthy"
+        with self.assertLogs("apps.harvesting.pipeline", level="WARNING"):
+            results = run_harvest(date(2024, 1, 15), [partial, BrokenProvider(), healthy])
+
+        by_name = {result.provider: result for result in results}
+        self.assertEqual(by_name["fake"].written, 2)
+        self.assertEqual(len(by_name["fake"].errors), 1)
+        self.assertFalse(by_name["broken"].ok)
+        self.assertTrue(by_name["healthy"].ok)
+        self.assertEqual(by_name["healthy"].written, 3)
+
+    def test_rate_limiter(self):
+        """요청 간 최소 간격 보장"""
+
+        async def acquire_times():
+            limiter = RateLimiter(rate=20)
+            times = []
+            for _ in range(3):
+                await limiter.acquire()
+                times.append(time.monotonic())
+            return times
+
+        times = asyncio.run(acquire_times())
+        self.assertGreaterEqual(times[2] - times[0], 0.09)
+
+
+class KoreaEximProviderTestCase(TestCase):
+    """수출입은행 프로바이더 테스트"""
+
+    @patch("apps.exchange_rates.providers.afetch_decoded_rates")
+    def test_harvest_exchange_rates(self, mock_fetch):
+        """파이프라인을 통한 환율 저장"""
+        payload = [
+            {"cur_unit": "USD", "cur_nm": "미국 달러", "deal_bas_r": "1,432.50"},
+            {"cur_unit": "", "cur_nm": ""},
+        ]
+        mock_fetch.return_value = decode_items(payload)
+
+        [result] = run_harvest(date(2024, 1, 15), [KoreaEximProvider()])
+
+        self.assertTrue(result.ok)
+        self.assertEqual(result.fetched, 1)  # 빈 통화 코드 항목은 디코더에서 제외
+        self.assertEqual(result.written, 1)
+        self.assertTrue(ExchangeRate.objects.filter(code="USD", date=date(2024, 1, 15)).exists())
+        # 빈 통화 코드 항목까지 포함한 원본 전체의 지문 (save_exchange_rates와 같은 값)
+        self.assertEqual(
+            ExchangeRatePayload.objects.get(date=date(2024, 1, 15)).fingerprint, payload_fingerprint(payload)
+        )
@@ -0,0 +1,185 @@
+"""
+WSGI(gunicorn sync) vs ASGI(gunicorn + uvicorn worker) 동시 요청 처리량 비교
+
+임시 SQLite DB에 환율 데이터를 채운 뒤 두 서버를 차례로 띄우고,
+동일한 동시성으로 읽기 엔드포인트를 호출해 초당 처리 요청 수(RPS)를 출력합니다.
+
+--slow-fetches N 을 주면 응답이 --upstream-delay 초 걸리는 가짜 수출입은행 API를 띄우고,
+읽기 부하와 동시에 N개의 수집 요청(POST /api/exchange-rates/fetch/)을 계속 보내
+느린 외부 호출이 워커를 점유하는 상황을 재현합니다.
+
+사용법:
+    uv run python benchmarks/asgi_vs_wsgi.py --concurrency 64 --requests 2000
+    uv run python benchmarks/asgi_vs_wsgi.py --slow-fetches 8 --upstream-delay 2
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+SERVERS = {
+    "wsgi": ["gunicorn", "config.wsgi:application"],
+    "asgi": ["gunicorn", "config.asgi:application", "--worker-class", "uvicorn_worker.UvicornWorker"],
+}
+
+SEED_SCRIPT = """
+from datetime import date, timedelta
+from decimal import Decimal
+from apps.exchange_rates.models import ExchangeRate
+
+codes = ["USD", "EUR", "JPY(100)", "CNH", "GBP", "CHF", "CAD", "AUD"]
+start = date(2020, 1, 1)
+ExchangeRate.objects.bulk_create(
+    ExchangeRate(code=code, name=code, base_rate=Decimal("1000") + i, date=start + timedelta(days=i))
+    for i in range({days})
+    for code in codes
+)
+"""
+
+
+def start_fake_upstream(delay: float) -> ThreadingHTTPServer:
+    """delay초 후 빈 목록(휴일 응답)을 돌려주는 가짜 수출입은행 API"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(delay)
+            body = b"[]"
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def prepare_database(env: dict[str, str], days: int) -> None:
+    """임시 DB 마이그레이션 및 시드 데이터 생성"""
+    manage = [sys.executable, "manage.py"]
+    subprocess.run([*manage, "migrate", "--noinput", "-v", "0"], cwd=BASE_DIR, env=env, check=True)
+    subprocess.run(
+        [*manage, "shell", "-v", "0", "-c", SEED_SCRIPT.format(days=days)], cwd=BASE_DIR, env=env, check=True
+    )
+
+
+async def wait_until_ready(url: str, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get(url)
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+    raise RuntimeError(f"서버가 {timeout}초 안에 시작되지 않았습니다: {url}")
+
+
+async def run_load(
+    url: str, total: int, concurrency: int, fetch_url: str = "", slow_fetches: int = 0
+) -> tuple[float, int]:
+    """동시성 concurrency로 total건 요청 후 (RPS, 실패 건수) 반환"""
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for i in range(total):
+        queue.put_nowait(i)
+    errors = 0
+    done = asyncio.Event()
+
+    async def slow_fetcher(client: httpx.AsyncClient) -> None:
+        while not done.is_set():
+            await client.post(fetch_url)
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        nonlocal errors
+        while not queue.empty():
+            queue.get_nowait()
+            response = await client.get(url)
+            if response.status_code != 200:
+                errors += 1
+
+    limits = httpx.Limits(max_connections=concurrency + slow_fetches)
+    async with httpx.AsyncClient(limits=limits, timeout=120) as client:
+        fetchers = [asyncio.create_task(slow_fetcher(client)) for _ in range(slow_fetches)]
+        await asyncio.sleep(0.5 if slow_fetches else 0)  # 수집 요청이 워커를 먼저 점유하도록 대기
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await asyncio.gather(*fetchers)
+    return total / elapsed, errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--days", type=int, default=365, help="시드 데이터 일수 (통화 8종)")
+    parser.add_argument("--path", default="/api/exchange-rates/USD/")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--slow-fetches", type=int, default=0, help="읽기 부하와 동시에 유지할 수집 요청 수")
+    parser.add_argument("--upstream-delay", type=float, default=2.0, help="가짜 수출입은행 API 응답 지연 (초)")
+    args = parser.parse_args()
+
+    upstream = start_fake_upstream(args.upstream_delay)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": "config.settings",
+            "DEBUG": "False",
+            "ALLOWED_HOSTS": "127.0.0.1",
+            "SQLITE_PATH": str(Path(tmp) / "bench.sqlite3"),
+            "KOREAEXIM_API_KEY": "benchmark",
+            "KOREAEXIM_API_URL": f"http://127.0.0.1:{upstream.server_port}/",
+        }
+        env.pop("DB_ENGINE", None)
+        prepare_database(env, args.days)
+
+        url = f"http://127.0.0.1:{args.port}{args.path}"
+        fetch_url = f"http://127.0.0.1:{args.port}/api/exchange-rates/fetch/"
+        print(f"{args.requests} requests, concurrency={args.concurrency}, workers={args.workers}, GET {args.path}")
+        if args.slow_fetches:
+            print(f"  + {args.slow_fetches} concurrent fetches, upstream delay {args.upstream_delay}s")
+        for name, command in SERVERS.items():
+            server = subprocess.Popen(
+                [
+                    *command,
+                    "--bind",
+                    f"127.0.0.1:{args.port}",
+                    "--workers",
+                    str(args.workers),
+                    "--log-level",
+                    "warning",
+                ],
+                cwd=BASE_DIR,
+                env=env,
+            )
+            try:
+                asyncio.run(wait_until_ready(url))
+                asyncio.run(run_load(url, min(args.requests, 100), args.concurrency))  # warm-up
+                rps, errors = asyncio.run(run_load(url, args.requests, args.concurrency, fetch_url, args.slow_fetches))
+                print(f"  {name}: {rps:8.1f} req/s  (errors: {errors})")
+            finally:
+                server.terminate()
+                server.wait()
+    upstream.shutdown()
+
+
+if __name__ == "__main__":
+    main()
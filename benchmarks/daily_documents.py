@@ -0,0 +1,73 @@
+"""
+일별 환율 조회: 동적 직렬화 vs 사전 렌더링 문서
+
+같은 고시일 조회를 두 경로로 반복해 평균 응답 시간과 응답 크기를 비교합니다.
+  - dynamic:  ExchangeRate 조회 + ExchangeRateSerializer + JSONRenderer
+  - rendered: RenderedDocument 키 조회 + 바이트 복사 (identity / gzip)
+
+사용법:
+    uv run python benchmarks/daily_documents.py --repeat 500
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ["DJANGO_SETTINGS_MODULE"] = "config.settings"
+os.environ.pop("DB_ENGINE", None)
+os.environ["SQLITE_PATH"] = str(Path(tempfile.mkdtemp()) / "bench.sqlite3")
+os.environ["ALLOWED_HOSTS"] = "testserver"
+
+import django  # noqa: E402
+
+django.setup()
+
+from datetime import date  # noqa: E402
+from decimal import Decimal  # noqa: E402
+
+from django.core.management import call_command  # noqa: E402
+from django.test import Client  # noqa: E402
+
+from apps.exchange_rates.documents import render_daily_documents  # noqa: E402
+from apps.exchange_rates.models import ExchangeRate, RenderedDocument  # noqa: E402
+
+CODES = [f"C{i:02d}" for i in range(23)]  # 수출입은행 고시 통화 수와 비슷하게
+RATE_DATE = date(2024, 1, 15)
+
+
+def timed(client: Client, path: str, repeat: int, **headers) -> tuple[float, int]:
+    response = client.get(path, headers=headers)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        client.get(path, headers=headers)
+    return (time.perf_counter() - started) / repeat * 1000, len(response.content)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    call_command("migrate", verbosity=0)
+    ExchangeRate.objects.bulk_create(
+        ExchangeRate(code=code, name=code, base_rate=Decimal("1000.1234"), date=RATE_DATE) for code in CODES
+    )
+    client = Client()
+    path = f"/api/exchange-rates/dates/{RATE_DATE}/"
+
+    dynamic = timed(client, path, args.repeat)
+    render_daily_documents(RATE_DATE)
+    rendered = timed(client, path, args.repeat)
+    rendered_gzip = timed(client, path, args.repeat, accept_encoding="gzip")
+    assert RenderedDocument.objects.exists()
+
+    for name, (elapsed, size) in {"dynamic": dynamic, "rendered": rendered, "rendered gzip": rendered_gzip}.items():
+        print(f"{name:14s} {elapsed:6.2f} ms  {size:6d} bytes")
+
+
+if __name__ == "__main__":
+    main()
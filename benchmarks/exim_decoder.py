@@ -0,0 +1,121 @@
+"""
+수출입은행 응답 처리: 기존 경로 vs 한 번 순회 디코더
+
+같은 응답 본문(bytes)을 다음 경로로 반복 처리해 평균 시간을 비교합니다.
+  - legacy: json.loads → payload_fingerprint(json.dumps 전체) → 항목별 item.get + parse_rate
+  - items:  json.loads → decode_items (검증/변환/지문 한 번 순회)
+  - stream: 8KB 청크 → decode_stream (파싱까지 한 번 순회, 본문 전체를 list로 만들지 않음)
+경로별 평균 처리 시간과 tracemalloc 기준 최대 메모리 사용량(본문 bytes 제외)을 출력합니다.
+
+사용법:
+    uv run python benchmarks/exim_decoder.py --items 23 --repeat 2000
+    uv run python benchmarks/exim_decoder.py --items 20000 --repeat 5   # 일괄 재처리 규모
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+import tracemalloc
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from apps.exchange_rates.decoder import decode_items, decode_stream  # noqa: E402
+
+
+def parse_rate(value):
+    # services.parse_rate와 동일 (Django 설정 없이 실행하기 위해 복사)
+    if not value:
+        return None
+    try:
+        return Decimal(value.replace(",", ""))
+    except (InvalidOperation, AttributeError):
+        return None
+
+
+def legacy(body: bytes):
+    data = json.loads(body)
+    hashlib.sha256(json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode()).hexdigest()
+    parsed = {}
+    for item in data:
+        code = item.get("cur_unit", "").strip()
+        if not code:
+            continue
+        parsed[code] = {
+            "name": item.get("cur_nm", ""),
+            "base_rate": parse_rate(item.get("deal_bas_r")),
+            "cash_buy_rate": parse_rate(item.get("bkpr")),
+            "cash_sell_rate": parse_rate(item.get("kftc_bkpr")),
+            "remit_send_rate": parse_rate(item.get("tts")),
+            "remit_receive_rate": parse_rate(item.get("ttb")),
+        }
+    return parsed
+
+
+def currency_code(index: int) -> str:
+    # 실제 통화 코드처럼 영문 대문자만 사용 (AAA, AAB, ... 개수가 많으면 네 글자)
+    letters = ""
+    for _ in range(3 if index < 26**3 else 4):
+        index, rest = divmod(index, 26)
+        letters = chr(ord("A") + rest) + letters
+    return letters
+
+
+def make_body(count: int) -> bytes:
+    items = [
+        {
+            "result": 1,
+            "cur_unit": currency_code(i),
+            "cur_nm": f"통화 {i}",
+            "ttb": "1,418.12",
+            "tts": "1,447.88",
+            "deal_bas_r": "1,432.50",
+            "bkpr": "1,432",
+            "yy_efee_r": "0",
+            "ten_dd_efee_r": "0",
+            "kftc_bkpr": "1,432",
+            "kftc_deal_bas_r": "1,432.5",
+        }
+        for i in range(count)
+    ]
+    return json.dumps(items, ensure_ascii=False).encode()
+
+
+def timed(func, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def peak_kib(func) -> float:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=23)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    body = make_body(args.items)
+    chunks = [body[i : i + 8192] for i in range(0, len(body), 8192)]
+    print(f"{args.items} items, {len(body)} bytes")
+    paths = {
+        "legacy": lambda: legacy(body),
+        "items": lambda: decode_items(json.loads(body)),
+        "stream": lambda: decode_stream(chunks),
+    }
+    for name, func in paths.items():
+        print(f"  {name:<7} {timed(func, args.repeat):9.3f} ms  peak {peak_kib(func):9.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+수집 전용 엔트리포인트 콜드 스타트 시간 측정
+
+각 구성을 새 프로세스로 여러 번 실행해 Django 초기화 + 수집 서비스 import까지
+걸리는 시간(수집 직전까지)의 중앙값/최솟값을 출력합니다.
+
+사용법:
+    uv run python benchmarks/ingest_startup.py --runs 10
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+FULL_SETUP = (
+    "import django; django.setup(); "
+    "import rest_framework.viewsets, apps.exchange_rates.views, apps.exchange_rates.services"
+)
+
+SCENARIOS = {
+    "manage.py check (full)": ([sys.executable, "manage.py", "check"], "config.settings"),
+    "full settings setup": ([sys.executable, "-c", FULL_SETUP], "config.settings"),
+    "ingest.py --dry-run": ([sys.executable, "ingest.py", "--dry-run"], "config.settings_ingest"),
+}
+
+
+def measure(command: list[str], settings_module: str, runs: int) -> list[float]:
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings_module, "PYTHONDONTWRITEBYTECODE": "0"}
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, cwd=BASE_DIR, env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    for name, (command, settings_module) in SCENARIOS.items():
+        measure(command, settings_module, 1)  # .pyc 캐시 워밍업
+        timings = measure(command, settings_module, args.runs)
+        print(f"{name:26s} median {statistics.median(timings) * 1000:7.1f} ms  min {min(timings) * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+환율 이력 관리자 목록: 기본 ModelAdmin vs 대용량 테이블 설정
+
+이력 행 수를 늘려가며 같은 화면을 두 설정으로 렌더링해 평균 시간을 비교합니다.
+  - legacy: list_filter(code, date) + date_hierarchy + search_fields(code, name) + OFFSET 페이지
+  - large:  ExchangeRateAdmin (추정 건수, 통화 집합 필터, 코드 접두어 검색, keyset 커서)
+
+화면:
+  first   첫 페이지
+  deep    목록 중간 페이지 (legacy: ?p=N, large: 같은 위치의 커서)
+  search  통화 코드 검색 (q=US)
+  filter  통화 필터 (code=USD)
+
+사용법:
+    uv run python benchmarks/large_admin.py --rows 100000 1000000 --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ["DJANGO_SETTINGS_MODULE"] = "config.settings"
+os.environ.pop("DB_ENGINE", None)
+os.environ["SQLITE_PATH"] = str(Path(tempfile.mkdtemp()) / "bench.sqlite3")
+os.environ["ALLOWED_HOSTS"] = "testserver"
+
+import django  # noqa: E402
+
+django.setup()
+
+from datetime import date, timedelta  # noqa: E402
+from decimal import Decimal  # noqa: E402
+
+from django.contrib import admin  # noqa: E402
+from django.contrib.auth.models import User  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+
+from apps.exchange_rates.admin import ExchangeRateAdmin  # noqa: E402
+from apps.exchange_rates.changelist import encode_cursor  # noqa: E402
+from apps.exchange_rates.models import ExchangeRate  # noqa: E402
+from apps.exchange_rates.services import update_latest_rates  # noqa: E402
+
+CODES = [f"{a}{b}D" for a in "ABCDEFGHIJ" for b in "STUV"][:39] + ["USD"]
+
+
+class LegacyExchangeRateAdmin(admin.ModelAdmin):
+    # 변경 전 ExchangeRateAdmin 설정
+    list_display = ["code", "name", "base_rate", "date", "fetched_at"]
+    list_filter = ["code", "date"]
+    search_fields = ["code", "name"]
+    date_hierarchy = "date"
+    ordering = ["-date", "code"]
+
+
+def seed(rows: int) -> None:
+    ExchangeRate.objects.all().delete()
+    start = date(1900, 1, 1)
+    days = rows // len(CODES)
+    batch = []
+    for i in range(days):
+        day = start + timedelta(days=i)
+        batch.extend(
+            ExchangeRate(code=code, name=f"통화 {code}", base_rate=Decimal("1000"), date=day) for code in CODES
+        )
+        if len(batch) >= 20000:
+            ExchangeRate.objects.bulk_create(batch)
+            batch = []
+    ExchangeRate.objects.bulk_create(batch)
+    last_date = start + timedelta(days=days - 1)
+    update_latest_rates(list(ExchangeRate.objects.filter(date=last_date)))
+
+
+def timed(model_admin, request_factory, user, params: dict, repeat: int) -> float:
+    def render():
+        request = request_factory.get("/admin/exchange_rates/exchangerate/", params)
+        request.user = user
+        response = model_admin.changelist_view(request)
+        response.render()
+        assert response.status_code == 200, response.status_code
+
+    render()  # 워밍업
+    started = time.perf_counter()
+    for _ in range(repeat):
+        render()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    call_command("migrate", verbosity=0)
+    user = User.objects.create_superuser("bench", "bench@example.com", "bench")
+    request_factory = RequestFactory()
+    legacy = LegacyExchangeRateAdmin(ExchangeRate, admin.site)
+    large = ExchangeRateAdmin(ExchangeRate, admin.site)
+
+    for rows in args.rows:
+        seed(rows)
+        page = rows // large.list_per_page // 2
+        row = ExchangeRate.objects.order_by("-date", "code")[page * large.list_per_page - 1]
+        screens = {
+            "first": ({}, {}),
+            "deep": ({"p": page + 1}, {"after": encode_cursor([row.date.isoformat(), row.code])}),
+            "search": ({"q": "US"}, {"q": "US"}),
+            "filter": ({"code": "USD"}, {"code": "USD"}),
+        }
+        print(f"{ExchangeRate.objects.count():>9} rows")
+        for name, (legacy_params, large_params) in screens.items():
+            legacy_ms = timed(legacy, request_factory, user, legacy_params, args.repeat)
+            large_ms = timed(large, request_factory, user, large_params, args.repeat)
+            print(f"  {name:<7} legacy {legacy_ms:9.2f} ms  large {large_ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
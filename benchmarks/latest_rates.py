@@ -0,0 +1,79 @@
+"""
+최신 환율 조회: 이력 테이블 스캔 vs 스냅샷 엔드포인트
+
+이력 일수를 늘려가며 다음 두 방식의 평균 응답 시간을 비교합니다.
+  - history:  GET /api/exchange-rates/?date=<최신 고시일>  (이력 테이블 조회)
+  - snapshot: GET /api/exchange-rates/latest/               (스냅샷 + 프로세스 로컬 캐시)
+
+사용법:
+    uv run python benchmarks/latest_rates.py --days 365 3650 --repeat 200
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ["DJANGO_SETTINGS_MODULE"] = "config.settings"
+os.environ.pop("DB_ENGINE", None)
+os.environ["SQLITE_PATH"] = str(Path(tempfile.mkdtemp()) / "bench.sqlite3")
+os.environ["ALLOWED_HOSTS"] = "testserver"
+
+import django  # noqa: E402
+
+django.setup()
+
+from datetime import date, timedelta  # noqa: E402
+from decimal import Decimal  # noqa: E402
+
+from django.core.management import call_command  # noqa: E402
+from django.test import Client  # noqa: E402
+
+from apps.exchange_rates.models import ExchangeRate  # noqa: E402
+from apps.exchange_rates.services import update_latest_rates  # noqa: E402
+
+CODES = ["USD", "EUR", "JPY(100)", "CNH", "GBP", "CHF", "CAD", "AUD", "HKD", "SGD", "THB", "SEK", "NZD"]
+
+
+def seed(days: int) -> date:
+    ExchangeRate.objects.all().delete()
+    start = date(2000, 1, 1)
+    rates = [
+        ExchangeRate(code=code, name=code, base_rate=Decimal("1000") + i, date=start + timedelta(days=i))
+        for i in range(days)
+        for code in CODES
+    ]
+    ExchangeRate.objects.bulk_create(rates, batch_size=5000)
+    last_date = start + timedelta(days=days - 1)
+    update_latest_rates(list(ExchangeRate.objects.filter(date=last_date)))
+    return last_date
+
+
+def timed(client: Client, path: str, repeat: int) -> float:
+    client.get(path)  # 워밍업 (캐시 채우기)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        client.get(path)
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, nargs="+", default=[365, 3650])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    call_command("migrate", verbosity=0)
+    client = Client()
+    for days in args.days:
+        last_date = seed(days)
+        history = timed(client, f"/api/exchange-rates/?date={last_date}", args.repeat)
+        snapshot = timed(client, "/api/exchange-rates/latest/", args.repeat)
+        print(f"{days * len(CODES):>8} rows  history {history:6.2f} ms  snapshot {snapshot:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
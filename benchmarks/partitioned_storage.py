@@ -0,0 +1,144 @@
+"""
+환율 이력 저장소: 단일 테이블(B-tree 6개) vs 연도별 파티션 + BRIN (PostgreSQL)
+
+같은 데이터를 두 구성으로 만들어 다음을 비교합니다.
+  - index   인덱스 전체 크기
+  - insert  이력 다음 해 --insert-days일치 INSERT (기존 이력이 쌓인 상태에서)
+  - year    1년 구간 집계          filter(date__range=1년).aggregate(Avg)
+  - month   1개월 구간 조회        filter(date__range=1개월)
+  - code    통화 1개 5년 구간 조회 filter(code=..., date__range=5년)
+
+PostgreSQL 접속 정보(DB_ENGINE, DB_HOST 등)는 config.settings와 같은 환경 변수를 사용하며,
+벤치마크 전용 DB(--database, 기본 market_data_bench)를 새로 만들어 사용합니다.
+
+사용법:
+    DB_ENGINE=django.db.backends.postgresql uv run python benchmarks/partitioned_storage.py --years 36 --codes 40
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ["DJANGO_SETTINGS_MODULE"] = "config.settings"
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--database", default="market_data_bench")
+parser.add_argument("--years", type=int, default=36, help="이력 연수 (1990년부터)")
+parser.add_argument("--codes", type=int, default=40, help="통화 수")
+parser.add_argument("--insert-days", type=int, default=365, help="insert 측정에 추가할 일수")
+parser.add_argument("--repeat", type=int, default=20)
+args = parser.parse_args()
+
+if os.getenv("DB_ENGINE") != "django.db.backends.postgresql":
+    sys.exit("PostgreSQL 전용 벤치마크입니다 (DB_ENGINE=django.db.backends.postgresql)")
+os.environ["DB_NAME"] = args.database
+
+import django  # noqa: E402
+
+django.setup()
+
+from datetime import date, timedelta  # noqa: E402
+
+from django.core.management import call_command  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.db.models import Avg  # noqa: E402
+
+from apps.exchange_rates import partitioning  # noqa: E402
+from apps.exchange_rates.models import ExchangeRate  # noqa: E402
+
+FIRST_YEAR = 1990
+
+
+def recreate_database() -> None:
+    with connection._nodb_cursor() as cursor:
+        cursor.execute(f"DROP DATABASE IF EXISTS {args.database}")
+        cursor.execute(f"CREATE DATABASE {args.database}")
+
+
+def insert_rows(first_day: date, days: int) -> None:
+    # 서버에서 직접 생성 (first_day부터 days일, 통화 --codes개, 매일 고시)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {partitioning.TABLE} (code, name, base_rate, date, fetched_at, updated_at) "
+            "SELECT 'C' || lpad(c::text, 3, '0'), '통화', 1000 + random() * 100, d, now(), now() "
+            "FROM generate_series(%s::date, %s::date, '1 day') d CROSS JOIN generate_series(1, %s) c",
+            [first_day, first_day + timedelta(days=days - 1), args.codes],
+        )
+
+
+def seed() -> None:
+    insert_rows(date(FIRST_YEAR, 1, 1), (date(FIRST_YEAR + args.years, 1, 1) - date(FIRST_YEAR, 1, 1)).days)
+    with connection.cursor() as cursor:
+        cursor.execute(f"VACUUM ANALYZE {partitioning.TABLE}")
+
+
+def index_size_mib() -> float:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT COALESCE(SUM(pg_relation_size(i.indexrelid)), 0) FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indrelid "
+            "WHERE c.oid = %s::regclass OR c.oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = %s::regclass)",
+            [partitioning.TABLE, partitioning.TABLE],
+        )
+        return cursor.fetchone()[0] / 1024 / 1024
+
+
+def timed(func, repeat: int) -> float:
+    func()  # 워밍업
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def insert_ms() -> float:
+    # 이력 다음 해부터 --insert-days일치 (인덱스 유지 비용 비교를 위해 DB 안에서 생성)
+    start = date(FIRST_YEAR + args.years, 1, 1)
+    partitioning.ensure_partitions([start, start + timedelta(days=args.insert_days)])  # 파티션 생성 시간은 제외
+    elapsed = []
+    for _ in range(3):
+        started = time.perf_counter()
+        insert_rows(start, args.insert_days)
+        elapsed.append((time.perf_counter() - started) * 1000)
+        ExchangeRate.objects.filter(date__gte=start).delete()
+        with connection.cursor() as cursor:
+            cursor.execute(f"VACUUM {partitioning.TABLE}")
+    return sorted(elapsed)[1]  # 3회 중앙값
+
+
+def measure(layout: str) -> None:
+    middle = FIRST_YEAR + args.years // 2
+    year = (date(middle, 1, 1), date(middle, 12, 31))
+    month = (date(middle, 6, 1), date(middle, 6, 30))
+    five_years = (date(middle - 5, 1, 1), date(middle - 1, 12, 31))
+    queries = {
+        "year": lambda: ExchangeRate.objects.filter(date__range=year).aggregate(Avg("base_rate")),
+        "month": lambda: list(ExchangeRate.objects.filter(date__range=month)),
+        "code": lambda: list(ExchangeRate.objects.filter(code="C001", date__range=five_years)),
+    }
+    print(f"  {layout:<12} index {index_size_mib():8.1f} MiB  insert {insert_ms():8.1f} ms", end="")
+    for name, query in queries.items():
+        print(f"  {name} {timed(query, args.repeat):7.2f} ms", end="")
+    print()
+
+
+def main() -> None:
+    recreate_database()
+    call_command("migrate", "exchange_rates", verbosity=0)
+    seed()
+    print(f"{ExchangeRate.objects.count()} rows ({args.years} years x {args.codes} codes)")
+    measure("heap")
+
+    started = time.perf_counter()
+    call_command("partition_exchange_rates", verbosity=0)
+    print(f"  (파티션 전환 {time.perf_counter() - started:.1f} s)")
+    with connection.cursor() as cursor:
+        cursor.execute(f"VACUUM ANALYZE {partitioning.TABLE}")
+    measure("partitioned")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Primary/replica database routing for Market Data Harvester.
+
+- 쓰기와 트랜잭션 안의 읽기(수집 서비스)는 항상 primary(default)로 보냅니다.
+- 그 밖의 읽기는 헬스 체크를 통과한 replica 중 하나로 보내고,
+  사용 가능한 replica가 없으면 primary로 failover 합니다.
+- 쓰기가 일어난 요청/작업 안에서는 이후 읽기도 primary로 고정(read-your-writes)하며,
+  ReplicaPinningMiddleware가 쿠키로 다음 요청들까지 고정을 이어갑니다.
+"""
+
+import logging
+import random
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+PIN_COOKIE_NAME = "primary_pinned"
+
+_pinned: ContextVar[bool] = ContextVar("primary_pinned", default=False)
+
+# replica alias -> (정상 여부, 확인 시각)
+_health: dict[str, tuple[bool, float]] = {}
+
+
+def pin_to_primary() -> None:
+    """현재 요청/작업의 이후 읽기를 primary로 고정"""
+    _pinned.set(True)
+
+
+def is_pinned() -> bool:
+    return _pinned.get()
+
+
+def _check_replica(alias: str) -> bool:
+    """replica에 SELECT 1을 보내 응답 여부 확인"""
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute("SELECT 1")
+        return True
+    except DatabaseError as e:
+        logger.warning(f"replica {alias} 헬스 체크 실패: {e}")
+        return False
+
+
+def is_replica_healthy(alias: str) -> bool:
+    """REPLICA_HEALTH_CHECK_INTERVAL초 동안 캐시된 replica 상태"""
+    now = time.monotonic()
+    healthy, checked_at = _health.get(alias, (True, None))
+    if checked_at is None or now - checked_at >= settings.REPLICA_HEALTH_CHECK_INTERVAL:
+        healthy = _check_replica(alias)
+        _health[alias] = (healthy, now)
+    return healthy
+
+
+class PrimaryReplicaRouter:
+    """읽기는 replica, 쓰기는 primary로 보내는 DB 라우터"""
+
+    def db_for_read(self, model, **hints):
+        if is_pinned() or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+
+        replicas = [alias for alias in settings.DATABASE_REPLICAS if is_replica_healthy(alias)]
+        if not replicas:
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        pin_to_primary()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replica는 primary의 복제본이므로 모든 alias 간 관계 허용
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaPinningMiddleware:
+    """
+    쓰기 요청 직후 REPLICA_PIN_SECONDS초 동안 같은 클라이언트의 읽기를 primary로 고정
+
+    수집(fetch) 직후 조회가 복제 지연 때문에 이전 데이터를 보지 않도록 합니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = self.process_request(request)
+        try:
+            response = self.get_response(request)
+            return self.process_response(request, response)
+        finally:
+            _pinned.reset(token)
+
+    async def __acall__(self, request):
+        token = self.process_request(request)
+        try:
+            response = await self.get_response(request)
+            return self.process_response(request, response)
+        finally:
+            _pinned.reset(token)
+
+    def process_request(self, request):
+        return _pinned.set(PIN_COOKIE_NAME in request.COOKIES)
+
+    def process_response(self, request, response):
+        if is_pinned() and request.method not in ("GET", "HEAD", "OPTIONS"):
+            response.set_cookie(PIN_COOKIE_NAME, "1", max_age=settings.REPLICA_PIN_SECONDS, httponly=True)
+        return response
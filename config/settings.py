@@ -67,6 +67,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "config.wsgi.application"
+ASGI_APPLICATION = "config.asgi.application"
 
 
 # Database
@@ -74,6 +75,7 @@ WSGI_APPLICATION = "config.wsgi.application"
 
 # Database configuration - supports both SQLite (dev) and PostgreSQL (Docker)
 if os.getenv("DB_ENGINE"):
+    DB_CONN_MAX_AGE = int(os.getenv("DB_CONN_MAX_AGE", "0"))
     DATABASES = {
         "default": {
             "ENGINE": os.getenv("DB_ENGINE"),
@@ -82,16 +84,44 @@ if os.getenv("DB_ENGINE"):
             "PASSWORD": os.getenv("DB_PASSWORD", ""),
             "HOST": os.getenv("DB_HOST", "localhost"),
             "PORT": os.getenv("DB_PORT", "5432"),
+            "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": DB_CONN_MAX_AGE != 0,
         }
     }
+
+    # Read replicas (선택): DB_REPLICA_HOSTS=replica1,replica2
+    # 계정/DB 이름은 primary와 같고, 포트와 persistent connection 수명은 별도 지정 가능
+    DB_REPLICA_CONN_MAX_AGE = int(os.getenv("DB_REPLICA_CONN_MAX_AGE", str(DB_CONN_MAX_AGE)))
+    for index, replica_host in enumerate(filter(None, os.getenv("DB_REPLICA_HOSTS", "").split(",")), start=1):
+        DATABASES[f"replica_{index}"] = {
+            **DATABASES["default"],
+            "HOST": replica_host.strip(),
+            "PORT": os.getenv("DB_REPLICA_PORT", DATABASES["default"]["PORT"]),
+            "CONN_MAX_AGE": DB_REPLICA_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": DB_REPLICA_CONN_MAX_AGE != 0,
+            "TEST": {"MIRROR": "default"},
+        }
 else:
     DATABASES = {
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
-            "NAME": BASE_DIR / "db.sqlite3",
+            "NAME": os.getenv("SQLITE_PATH", BASE_DIR / "db.sqlite3"),
         }
     }
 
+# Primary/replica routing (replica가 설정된 경우에만 활성화)
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias.startswith("replica_")]
+REPLICA_HEALTH_CHECK_INTERVAL = float(os.getenv("DB_REPLICA_HEALTH_CHECK_INTERVAL", "5"))
+REPLICA_PIN_SECONDS = int(os.getenv("DB_REPLICA_PIN_SECONDS", "10"))
+
+if DATABASE_REPLICAS:
+    DATABASE_ROUTERS = ["config.db_router.PrimaryReplicaRouter"]
+    MIDDLEWARE.insert(0, "config.db_router.ReplicaPinningMiddleware")
+
+# PostgreSQL 환율 이력 연도별 파티션 저장소 (선택, apps.exchange_rates.partitioning)
+# `manage.py partition_exchange_rates`로 전환한 DB에서 수집 시 올해부터 몇 년 뒤까지 파티션을 미리 만들지
+EXCHANGE_RATE_PARTITION_YEARS_AHEAD = int(os.getenv("DB_PARTITION_YEARS_AHEAD", "1"))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -138,7 +168,18 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # Korea Exim Bank API
 KOREAEXIM_API_KEY = os.getenv("KOREAEXIM_API_KEY", "")
-KOREAEXIM_API_URL = "https://oapi.koreaexim.go.kr/site/program/financial/exchangeJSON"
+KOREAEXIM_API_URL = os.getenv("KOREAEXIM_API_URL", "https://oapi.koreaexim.go.kr/site/program/financial/exchangeJSON")
+
+
+# Harvesting pipeline (apps.harvesting)
+HARVEST_PROVIDERS = [
+    "apps.exchange_rates.providers.KoreaEximProvider",
+]
+HARVEST_REQUEST_TIMEOUT = 30
+
+# GET /api/exchange-rates/latest/ 프로세스 로컬 캐시 수명 (초)
+# 같은 프로세스의 수집은 즉시, 다른 프로세스의 수집은 최대 이 시간 후 반영
+LATEST_RATES_CACHE_TTL = int(os.getenv("LATEST_RATES_CACHE_TTL", "60"))
 
 
 # Django REST Framework
@@ -0,0 +1,25 @@
+"""
+Headless ingestion settings for Market Data Harvester.
+
+수집 전용(cron/one-shot) 실행 환경을 위한 최소 설정입니다.
+DB, API 키 등은 config.settings를 그대로 따르고, 수집에 필요 없는
+admin/세션/메시지/staticfiles/DRF 앱과 미들웨어는 로드하지 않습니다.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+INSTALLED_APPS = [
+    "apps.exchange_rates",
+]
+
+MIDDLEWARE = []
+
+# 수집 작업은 읽기/쓰기 모두 primary에서 수행
+DATABASE_ROUTERS = []
+
+ROOT_URLCONF = "config.urls_ingest"
+
+TEMPLATES = []
+
+# 수집 작업은 번역 카탈로그가 필요 없음
+USE_I18N = False
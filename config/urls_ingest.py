@@ -0,0 +1,5 @@
+"""
+URL configuration for the headless ingestion profile (no HTTP endpoints).
+"""
+
+urlpatterns = []
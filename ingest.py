@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""
+Headless ingestion entrypoint.
+
+config.settings_ingest로 Django를 최소 구성으로 초기화한 뒤
+수출입은행 환율을 한 번 수집하고 종료합니다 (cron/one-shot 컨테이너용).
+
+    python ingest.py                    # 오늘 환율 수집
+    python ingest.py --date 2024-01-15  # 특정 날짜 환율 수집
+    python ingest.py --pipeline         # settings.HARVEST_PROVIDERS 전체 동시 수집
+    python ingest.py --date 2024-01-15 --replay response.json  # 저장된 원본 응답 재처리
+"""
+
+import argparse
+import logging
+import os
+import sys
+from datetime import date, datetime
+
+
+def parse_date(value: str) -> date:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError("날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력하세요.") from None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="수출입은행 환율 one-shot 수집")
+    parser.add_argument("--date", type=parse_date, default=None, help="수집할 날짜 (YYYY-MM-DD, 기본값: 오늘)")
+    parser.add_argument("--pipeline", action="store_true", help="등록된 모든 프로바이더를 수집 파이프라인으로 수집")
+    parser.add_argument("--replay", metavar="FILE", help="API 대신 저장된 원본 응답 파일을 스트리밍으로 재처리")
+    parser.add_argument("--dry-run", action="store_true", help="초기화만 수행하고 수집하지 않음 (기동 시간 측정용)")
+    args = parser.parse_args()
+    if args.replay and args.date is None:
+        parser.error("--replay에는 --date가 필요합니다.")
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings_ingest")
+
+    import django
+
+    django.setup()
+
+    from apps.exchange_rates.services import KoreaEximAPIError, replay_exchange_rates, save_exchange_rates
+
+    if args.dry_run:
+        return 0
+
+    if args.replay:
+        try:
+            with open(args.replay, "rb") as f:
+                count = replay_exchange_rates(iter(lambda: f.read(65536), b""), args.date)
+        except (OSError, ValueError, KoreaEximAPIError) as e:
+            logging.getLogger("ingest").error(str(e))
+            return 1
+        print(f"{args.date} 환율 원본 재처리 {count}건 저장 완료")
+        return 0
+
+    if args.pipeline:
+        from apps.harvesting.pipeline import run_harvest
+
+        results = run_harvest(args.date)
+        for result in results:
+            print(f"[{result.provider}] 수집 {result.fetched}건, 저장 {result.written}건, 오류 {len(result.errors)}건")
+        return 0 if all(result.ok for result in results) else 1
+
+    try:
+        count = save_exchange_rates(args.date)
+    except KoreaEximAPIError as e:
+        logging.getLogger("ingest").error(str(e))
+        return 1
+
+    print(f"{args.date or date.today()} 환율 데이터 {count}건 수집 완료")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    sys.exit(main())